@@ -3,21 +3,35 @@ import sys
 import time
 
 
-def main():
+def report_saved(future, path):
+    """Runs on the writer thread once the PNG has been written (or not)."""
+    if future.exception() is not None:
+        print(f"Failed to save {path}: {future.exception()}")
+    else:
+        print(f"Saved: {path}")
+
+
+def main(rate=44100, seconds=5):
     print("Infinite recording mode started. Press Ctrl+C to stop.")
     try:
         # Create a base folder for this infinite session
         session_folder = pst.create_session_folder()
 
-        while True:
-            print(f"\n[{time.ctime()}] Recording 5 seconds...")
-            audio_data = pst.record_audio(duration=5)
-
-            print("Generating spectrogram...")
-            fig, _ = pst.plot_spectrogram(audio_data)
-            output_file = pst.save_spectrogram(fig, session_folder)
-
-            print(f"Saved: {output_file}")
+        # Audio keeps being captured while each spectrogram is plotted, and
+        # PNG encoding happens on background threads
+        with pst.ContinuousRecorder(rate=rate) as recorder, pst.OutputWriter() as writer:
+            for audio_data in recorder.chunks(duration=seconds):
+                print(f"\n[{time.ctime()}] Got {seconds} seconds of audio")
+
+                print("Generating spectrogram...")
+                fig, _ = pst.plot_spectrogram(audio_data, rate=rate)
+                output_file, saved = pst.save_spectrogram(
+                    fig, session_folder, writer=writer, return_future=True)
+                saved.add_done_callback(
+                    lambda future, path=output_file: report_saved(future, path))
+
+                if recorder.overruns:
+                    print(f"Warning: {recorder.overruns} overruns so far")
 
     except KeyboardInterrupt:
         print("\nStopping infinite recording...")
@@ -5,7 +5,16 @@ from .spectrogram import (
     delete_latest_session_folder,
     get_default_directory,
     get_folder_size,
+    invalidate_folder_size,
     get_latest_session_folder,
+    compute_spectrogram,
+    compute_spectrogram_batch,
+    compute_multichannel_spectrogram,
+    spectrogram_cache_info,
+    set_spectrogram_cache_size,
+    clear_spectrogram_cache,
+    iter_wav_spectrogram,
+    compute_wav_spectrogram,
     plot_spectrogram,
     print_folder_size,
     record_audio,
@@ -13,16 +22,70 @@ from .spectrogram import (
     load_wav,
     load_and_plot_wav,
     load_wavs_from_directory,
+    iter_wavs_from_directory,
     plot_all_wavs,
     record_and_save_wav,
     play_wav,
     save_wav,
     normalize_audio,
     trim_silence,
+    normalize_wav,
+    trim_silence_wav,
     batch_process_wavs,
+    BatchResult,
     get_wav_info,
     to_mono,
-    to_stereo
+    to_stereo,
+    pcm_to_float
+)
+from .aio import (
+    record_audio_async,
+    load_wav_async,
+    compute_spectrogram_async,
+    save_spectrogram_async,
+    record_and_save_wav_async,
+    batch_process_wavs_async,
+)
+from .recorder import (
+    ContinuousRecorder,
+    RingBuffer,
+    RollingSpectrogram,
+)
+from .cache import SpectrogramCache
+from .manifest import SessionManifest
+from .storage import (
+    save_spectrogram_data,
+    load_spectrogram_data,
+)
+from .writer import OutputWriter
+from .mel import (
+    MelFilterbank,
+    mel_filterbank,
+    compute_mel_spectrogram,
+)
+from .resample import (
+    Resampler,
+    resample,
+    resample_wav,
+)
+from .segment import (
+    ActiveSegment,
+    Segmenter,
+    frame_rms,
+    segment_audio,
+    segment_wav,
+    iter_active_segments,
+    remove_silence,
+)
+from .metrics import (
+    MetricsSink,
+    MetricsCollector,
+    add_metrics_sink,
+    remove_metrics_sink,
+)
+from .render import (
+    render_spectrogram_image,
+    spectrogram_to_rgb,
 )
 
 __all__ = [
@@ -30,7 +93,16 @@ __all__ = [
     "delete_latest_session_folder",
     "get_default_directory",
     "get_folder_size",
+    "invalidate_folder_size",
     "get_latest_session_folder",
+    "compute_spectrogram",
+    "compute_spectrogram_batch",
+    "compute_multichannel_spectrogram",
+    "spectrogram_cache_info",
+    "set_spectrogram_cache_size",
+    "clear_spectrogram_cache",
+    "iter_wav_spectrogram",
+    "compute_wav_spectrogram",
     "plot_spectrogram",
     "print_folder_size",
     "record_audio",
@@ -38,14 +110,52 @@ __all__ = [
     "load_wav",
     "load_and_plot_wav",
     "load_wavs_from_directory",
+    "iter_wavs_from_directory",
     "plot_all_wavs",
     "record_and_save_wav",
     "play_wav",
     "save_wav",
     "normalize_audio",
     "trim_silence",
+    "normalize_wav",
+    "trim_silence_wav",
     "batch_process_wavs",
+    "BatchResult",
     "get_wav_info",
     "to_mono",
-    "to_stereo"
+    "to_stereo",
+    "pcm_to_float",
+    "record_audio_async",
+    "load_wav_async",
+    "compute_spectrogram_async",
+    "save_spectrogram_async",
+    "record_and_save_wav_async",
+    "batch_process_wavs_async",
+    "ContinuousRecorder",
+    "RingBuffer",
+    "RollingSpectrogram",
+    "SpectrogramCache",
+    "SessionManifest",
+    "save_spectrogram_data",
+    "load_spectrogram_data",
+    "OutputWriter",
+    "MelFilterbank",
+    "mel_filterbank",
+    "compute_mel_spectrogram",
+    "Resampler",
+    "resample",
+    "resample_wav",
+    "ActiveSegment",
+    "Segmenter",
+    "frame_rms",
+    "segment_audio",
+    "segment_wav",
+    "iter_active_segments",
+    "remove_silence",
+    "MetricsSink",
+    "MetricsCollector",
+    "add_metrics_sink",
+    "remove_metrics_sink",
+    "render_spectrogram_image",
+    "spectrogram_to_rgb"
 ]
@@ -0,0 +1,132 @@
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import Executor
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from . import metrics, spectrogram
+from .spectrogram import BatchResult
+
+
+async def _run(executor: Optional[Executor], func, *args, **kwargs):
+    """Run a blocking call on ``executor`` (the loop's default when None)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+async def record_audio_async(duration=3, rate=44100, channels=1,
+                             stream_factory: Optional[Callable] = None) -> np.ndarray:
+    """
+    Record audio without blocking the event loop.
+
+    Capture runs through an ``InputStream`` callback that resolves a future
+    once ``duration`` seconds have arrived, instead of ``sd.wait()``.
+    Returns a flattened array like :func:`record_audio`.
+    """
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+    total = int(rate * duration)
+    audio_data = np.zeros((total, channels), dtype=np.float32)
+    filled = 0
+
+    def callback(indata, frames, time_info, status):
+        nonlocal filled
+        if filled >= total:
+            return
+        count = min(frames, total - filled)
+        audio_data[filled:filled + count] = indata[:count]
+        filled += count
+        if filled >= total:
+            loop.call_soon_threadsafe(_resolve, done)
+
+    if stream_factory is None:
+        import sounddevice as sd
+        stream_factory = sd.InputStream
+
+    stream = stream_factory(samplerate=rate, channels=channels, dtype="float32",
+                            callback=callback)
+    with metrics.timed("record"):
+        stream.start()
+        try:
+            if total == 0:
+                _resolve(done)
+            await done
+        finally:
+            stream.stop()
+            stream.close()
+
+    return audio_data.flatten()
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+async def load_wav_async(path: str, executor: Optional[Executor] = None, **kwargs):
+    """Async :func:`load_wav`; decoding runs on ``executor``."""
+    return await _run(executor, spectrogram.load_wav, path, **kwargs)
+
+
+async def compute_spectrogram_async(data, executor: Optional[Executor] = None, **kwargs):
+    """Async :func:`compute_spectrogram`; the FFT runs on ``executor``."""
+    return await _run(executor, spectrogram.compute_spectrogram, data, **kwargs)
+
+
+async def save_spectrogram_async(fig, session_folder, executor: Optional[Executor] = None) -> str:
+    """Async :func:`save_spectrogram`; PNG encoding and writing run on ``executor``."""
+    return await _run(executor, spectrogram.save_spectrogram, fig, session_folder)
+
+
+async def record_and_save_wav_async(duration=3, rate=44100, channels=1, directory=None,
+                                    executor: Optional[Executor] = None,
+                                    stream_factory: Optional[Callable] = None) -> str:
+    """
+    Async :func:`record_and_save_wav`. Folder creation and :func:`save_wav`
+    run on ``executor`` while capture is awaited through the stream callback.
+    """
+    if directory is None:
+        directory = spectrogram.get_default_directory()
+
+    session_folder = await _run(executor, spectrogram.create_session_folder, directory)
+
+    audio_data = await record_audio_async(duration=duration, rate=rate, channels=channels,
+                                          stream_factory=stream_factory)
+
+    timestamp = time.ctime().replace(" ", "_").replace(":", "-")
+    filename = os.path.join(session_folder, f"recording_{timestamp}.wav")
+
+    await _run(executor, spectrogram.save_wav, filename, audio_data, rate)
+
+    print(f"Saved recording to: {filename}")
+    return filename
+
+
+async def batch_process_wavs_async(directory: str, executor: Optional[Executor] = None,
+                                   fast: bool = False,
+                                   concurrency: Optional[int] = None,
+                                   output_directory: Optional[str] = None) -> List[BatchResult]:
+    """
+    Async :func:`batch_process_wavs`. Files are rendered concurrently on
+    ``executor``; pass a ``ProcessPoolExecutor`` for CPU-bound scaling.
+    ``concurrency`` caps how many files are in flight at once.
+
+    Returns:
+        list of BatchResult(file, output_path, error) in sorted filename order
+    """
+    session_folder = await _run(executor, spectrogram.create_session_folder, output_directory)
+    files = await _run(executor, spectrogram._list_wav_files, directory)
+    limit = asyncio.Semaphore(concurrency or max(1, len(files)))
+
+    async def process(file):
+        path = os.path.join(directory, file)
+        output_path = os.path.join(session_folder, f"{os.path.splitext(file)[0]}.png")
+        async with limit:
+            result = await _run(executor, spectrogram._process_wav_file,
+                                path, output_path, fast)
+        return spectrogram._report_batch_result(result)
+
+    return list(await asyncio.gather(*(process(file) for file in files)))
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+from . import metrics
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_by_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS digests (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+"""
+
+
+def get_default_cache_directory() -> str:
+    """Return the default cache directory, next to the spectrogram sessions."""
+    from .spectrogram import get_default_directory
+
+    return str(Path(get_default_directory()).parent / "cache")
+
+
+def _key_param(value):
+    """
+    JSON form of a cache key parameter. Arrays (window functions) are keyed
+    by a digest of their float64 contents, like the in-memory plan cache.
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (np.ndarray, list, tuple)):
+        array = np.asarray(value, dtype=np.float64)
+        return {"array": hashlib.sha256(array.tobytes()).hexdigest(),
+                "shape": list(array.shape)}
+    raise TypeError(
+        f"Cannot build a cache key from parameter of type {type(value).__name__}")
+
+
+class SpectrogramCache:
+    """
+    Persistent, content-addressed cache of spectrogram arrays and PNGs.
+
+    Entries are keyed by a SHA-256 of the WAV file's bytes plus the
+    spectrogram parameters, so renamed or copied files still hit and edited
+    files miss. File digests are memoized by (path, size, mtime), so an
+    unchanged file is not even re-read. The least recently used entries are
+    evicted once the cache grows past ``max_bytes``.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 1 << 30):
+        if directory is None:
+            directory = get_default_cache_directory()
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(directory, "index.sqlite3"),
+                                   check_same_thread=False, isolation_level=None)
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def file_digest(self, path: str) -> str:
+        """SHA-256 of the file contents, memoized by path, size and mtime."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest FROM digests WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, stat.st_size, stat.st_mtime_ns)).fetchone()
+        if row is not None:
+            return row[0]
+
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, digest))
+        return digest
+
+    def key(self, path: str, kind: str, **params) -> str:
+        """Cache key for ``path``'s content, an entry kind and its parameters."""
+        payload = json.dumps({name: _key_param(value) for name, value in params.items()},
+                             sort_keys=True)
+        return hashlib.sha256(
+            f"{self.file_digest(path)}:{kind}:{payload}".encode()).hexdigest()
+
+    def _entry_path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def _lookup(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT filename FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None and os.path.exists(row[0]):
+                self._db.execute("UPDATE entries SET last_access = ? WHERE key = ?",
+                                 (time.time(), key))
+                self.hits += 1
+                metrics.count("cache_hits")
+                return row[0]
+            if row is not None:
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.misses += 1
+            metrics.count("cache_misses")
+            return None
+
+    def _store(self, key: str, suffix: str, write) -> str:
+        filename = self._entry_path(key, suffix)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        temp = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        write(temp)
+        os.replace(temp, filename)
+
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                             (key, filename, os.path.getsize(filename), time.time()))
+        self.evict()
+        return filename
+
+    def spectrogram(self, path: str, nfft=256, hop=128, window="hann",
+                    start=None, stop=None, unit="seconds") -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+        """
+        Return ``(power, freqs, times, samplerate)`` for a WAV file, decoding
+        and transforming it only on a cache miss.
+        """
+        from .spectrogram import compute_spectrogram, load_wav
+
+        key = self.key(path, "power", nfft=nfft, hop=hop, window=window,
+                       start=start, stop=stop, unit=unit)
+        cached = self._lookup(key)
+        if cached is not None:
+            with np.load(cached) as stored:
+                return stored["power"], stored["freqs"], stored["times"], int(stored["rate"])
+
+        data, rate = load_wav(path, start=start, stop=stop, unit=unit)
+        power, freqs, times = compute_spectrogram(
+            data, rate=rate, nfft=nfft, hop=hop, window=window)
+
+        def write(temp):
+            with open(temp, "wb") as f:
+                np.savez(f, power=power, freqs=freqs, times=times, rate=rate)
+
+        self._store(key, ".npz", write)
+        return power, freqs, times, rate
+
+    def image(self, path: str, output_path: str, nfft=256, hop=128, window="hann",
+              cmap="viridis") -> str:
+        """
+        Write the fast-rendered PNG of a WAV file to ``output_path``, copying
+        it from the cache when present.
+        """
+        from .render import render_spectrogram_image
+
+        def write(output):
+            power, _, _, _ = self.spectrogram(path, nfft=nfft, hop=hop, window=window)
+            render_spectrogram_image(power, output, cmap=cmap)
+
+        key = self.key(path, "png", nfft=nfft, hop=hop, window=window, cmap=cmap)
+        return self._copy_or_store(key, output_path, write)
+
+    def figure(self, path: str, output_path: str, fig, nfft=256, hop=128, window="hann",
+               start=None, stop=None, unit="seconds") -> str:
+        """
+        Save ``fig``, the :func:`plot_spectrogram` Figure of a WAV file with
+        these parameters, as a PNG at ``output_path``. The PNG is cached, so
+        later calls copy it instead of drawing and encoding the Figure.
+        """
+        def write(output):
+            with metrics.timed("encode", format="png"):
+                fig.savefig(output)
+
+        key = self.key(path, "figure", nfft=nfft, hop=hop, window=window,
+                       start=start, stop=stop, unit=unit)
+        return self._copy_or_store(key, output_path, write)
+
+    def _copy_or_store(self, key: str, output_path: str, write) -> str:
+        """Copy the cached PNG for ``key`` to ``output_path``, or write and cache it."""
+        cached = self._lookup(key)
+        if cached is not None:
+            shutil.copyfile(cached, output_path)
+            return output_path
+
+        write(output_path)
+        self._store(key, ".png", lambda temp: shutil.copyfile(output_path, temp))
+        return output_path
+
+    @property
+    def size(self) -> int:
+        """Total bytes of cached entries."""
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def evict(self, max_bytes: Optional[int] = None):
+        """Delete least recently used entries until the cache fits the budget."""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            total = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= budget:
+                return
+            rows = self._db.execute(
+                "SELECT key, filename, size FROM entries ORDER BY last_access").fetchall()
+            for key, filename, size in rows:
+                if total <= budget:
+                    break
+                try:
+                    os.remove(filename)
+                except FileNotFoundError:
+                    pass
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+
+    def clear(self):
+        """Remove every cached entry and reset the hit/miss counters."""
+        self.evict(max_bytes=0)
+        self.hits = 0
+        self.misses = 0
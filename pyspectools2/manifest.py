@@ -0,0 +1,153 @@
+import os
+import shutil
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import List, NamedTuple, Optional
+
+MANIFEST_DIRNAME = ".pyspectools2"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    number INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    size INTEGER
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class SessionRecord(NamedTuple):
+    number: int
+    path: str
+    created: float
+    size: Optional[int]
+
+
+class SessionManifest:
+    """
+    SQLite index of the ``session_<n>`` folders inside a spectrogram root.
+
+    Next-number allocation and latest-session lookup are single indexed
+    queries instead of a directory scan. Every transaction holds SQLite's
+    write lock, so concurrent processes never hand out the same number. The
+    root's mtime is recorded after each change the manifest makes; if it
+    differs on the next access, something else touched the root and the
+    manifest is rebuilt from disk.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.path = os.path.join(directory, MANIFEST_DIRNAME, "sessions.sqlite3")
+
+    @contextmanager
+    def _transaction(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            db.executescript(_SCHEMA)
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                if self._stored_mtime(db) != os.stat(self.directory).st_mtime_ns:
+                    self._rebuild(db)
+                yield db
+                self._store_mtime(db)
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        finally:
+            db.close()
+
+    @staticmethod
+    def _stored_mtime(db) -> Optional[int]:
+        row = db.execute("SELECT value FROM meta WHERE key = 'root_mtime_ns'").fetchone()
+        return None if row is None else row[0]
+
+    def _store_mtime(self, db):
+        db.execute("INSERT OR REPLACE INTO meta VALUES ('root_mtime_ns', ?)",
+                   (os.stat(self.directory).st_mtime_ns,))
+
+    def _rebuild(self, db):
+        """
+        Sync the index with the folders on disk. Rows of folders that still
+        exist keep their recorded creation time and size; new folders are
+        added and rows of deleted folders are dropped.
+        """
+        from .spectrogram import _SESSION_PATTERN
+
+        on_disk = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                match = _SESSION_PATTERN.match(entry.name)
+                if match and entry.is_dir():
+                    on_disk[int(match.group(1))] = entry.stat().st_ctime
+
+        indexed = {number for (number,) in db.execute("SELECT number FROM sessions")}
+        db.executemany("DELETE FROM sessions WHERE number = ?",
+                       [(number,) for number in indexed - on_disk.keys()])
+        db.executemany("INSERT INTO sessions (number, created) VALUES (?, ?)",
+                       [(number, on_disk[number]) for number in on_disk.keys() - indexed])
+
+    def _folder(self, number: int) -> str:
+        return os.path.join(self.directory, f"session_{number}")
+
+    def rebuild(self):
+        """Re-index the session folders from disk."""
+        with self._transaction() as db:
+            self._rebuild(db)
+
+    def allocate(self) -> str:
+        """Create the next ``session_<n>`` folder and return its path."""
+        with self._transaction() as db:
+            next_number = db.execute(
+                "SELECT COALESCE(MAX(number), 0) + 1 FROM sessions").fetchone()[0]
+            while True:
+                session_folder = self._folder(next_number)
+                try:
+                    os.makedirs(session_folder, exist_ok=False)
+                    break
+                except FileExistsError:
+                    next_number += 1
+            db.execute("INSERT OR REPLACE INTO sessions (number, created) VALUES (?, ?)",
+                       (next_number, time.time()))
+        return session_folder
+
+    def latest(self) -> Optional[str]:
+        """Return the path of the highest numbered session, or None."""
+        with self._transaction() as db:
+            row = db.execute("SELECT MAX(number) FROM sessions").fetchone()
+        return None if row[0] is None else self._folder(row[0])
+
+    def delete(self, session_folder: str):
+        """Delete a session folder from disk and from the index."""
+        number = _session_number(session_folder)
+        with self._transaction() as db:
+            shutil.rmtree(session_folder)
+            db.execute("DELETE FROM sessions WHERE number = ?", (number,))
+
+    def set_size(self, session_folder: str, size: int):
+        """Record the size in bytes of a session folder."""
+        number = _session_number(session_folder)
+        with self._transaction() as db:
+            db.execute("UPDATE sessions SET size = ? WHERE number = ?", (size, number))
+
+    def sessions(self) -> List[SessionRecord]:
+        """All indexed sessions in ascending order."""
+        with self._transaction() as db:
+            rows = db.execute(
+                "SELECT number, created, size FROM sessions ORDER BY number").fetchall()
+        return [SessionRecord(number, self._folder(number), created, size)
+                for number, created, size in rows]
+
+
+def _session_number(session_folder: str) -> int:
+    from .spectrogram import _SESSION_PATTERN
+
+    match = _SESSION_PATTERN.match(os.path.basename(os.path.normpath(session_folder)))
+    if match is None:
+        raise ValueError(f"{session_folder} is not a session folder")
+    return int(match.group(1))
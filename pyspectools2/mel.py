@@ -0,0 +1,146 @@
+import warnings
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .spectrogram import _power_to_db, compute_spectrogram, compute_spectrogram_batch
+
+_SCALES = ("mel", "log")
+_FILTERS_PER_BLOCK = 8
+
+
+def _hz_to_mel(hz):
+    return 2595.0 * np.log10(1.0 + np.asarray(hz, dtype=np.float64) / 700.0)
+
+
+def _mel_to_hz(mel):
+    return 700.0 * (10.0 ** (np.asarray(mel, dtype=np.float64) / 2595.0) - 1.0)
+
+
+class MelFilterbank(NamedTuple):
+    """
+    Triangular filterbank stored as bands of dense blocks.
+
+    Each filter is nonzero only over a contiguous run of FFT bins, so
+    consecutive filters are grouped into ``blocks`` of
+    ``(first_filter, first_bin, weights)`` where ``weights`` covers just the
+    bins those filters touch. Projection multiplies each block with its
+    slice of the spectrogram, skipping the zeros of a dense matrix.
+    """
+    blocks: Tuple[Tuple[int, int, np.ndarray], ...]
+    centers: np.ndarray
+    n_freqs: int
+
+    @property
+    def n_filters(self) -> int:
+        return len(self.centers)
+
+    def dense(self) -> np.ndarray:
+        """The filterbank as a dense ``(n_filters, n_freqs)`` matrix."""
+        matrix = np.zeros((self.n_filters, self.n_freqs))
+        for first, start, weights in self.blocks:
+            rows, width = weights.shape
+            matrix[first:first + rows, start:start + width] = weights
+        return matrix
+
+    def apply(self, power: np.ndarray) -> np.ndarray:
+        """Project ``(..., n_freqs, time)`` power onto ``(..., n_filters, time)``."""
+        power = np.asarray(power)
+        if power.ndim < 2 or power.shape[-2] != self.n_freqs:
+            raise ValueError(
+                f"Expected power with {self.n_freqs} frequency bins on axis -2, "
+                f"got shape {power.shape}")
+
+        shape = power.shape[:-2] + (self.n_filters, power.shape[-1])
+        out = np.empty(shape, dtype=np.result_type(power.dtype, np.float32))
+        for first, start, weights in self.blocks:
+            rows, width = weights.shape
+            np.matmul(weights, power[..., start:start + width, :],
+                      out=out[..., first:first + rows, :])
+        return out
+
+
+@lru_cache(maxsize=32)
+def mel_filterbank(rate: int, nfft: int, n_mels: int = 64, fmin: float = 0.0,
+                   fmax: Optional[float] = None, scale: str = "mel") -> MelFilterbank:
+    """
+    Build (once per argument set) triangular filters over ``nfft // 2 + 1``
+    FFT bins.
+
+    Filter edges are spaced evenly on the mel scale (HTK formula) or, with
+    ``scale="log"``, geometrically, between ``fmin`` and ``fmax`` (default
+    ``rate / 2``). Each triangle peaks at 1 on its center frequency. The
+    result is cached and shared, so its arrays are read-only.
+    """
+    if scale not in _SCALES:
+        raise ValueError(f"Unknown scale '{scale}'. Expected one of: {', '.join(_SCALES)}")
+    if n_mels <= 0 or nfft <= 0:
+        raise ValueError("n_mels and nfft must be positive integers")
+    fmax = rate / 2 if fmax is None else fmax
+    if not 0 <= fmin < fmax:
+        raise ValueError("Expected 0 <= fmin < fmax")
+    if scale == "log" and fmin <= 0:
+        raise ValueError("fmin must be positive for scale='log'")
+
+    if scale == "mel":
+        edges = _mel_to_hz(np.linspace(_hz_to_mel(fmin), _hz_to_mel(fmax), n_mels + 2))
+    else:
+        edges = np.geomspace(fmin, fmax, n_mels + 2)
+
+    bins = np.arange(nfft // 2 + 1) * rate / nfft
+    lower, center, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    weights = np.maximum(0.0, np.minimum((bins - lower) / (center - lower),
+                                         (upper - bins) / (upper - center)))
+
+    empty = ~weights.any(axis=1)
+    if empty.any():
+        warnings.warn(
+            f"{int(empty.sum())} of {n_mels} filters fall between FFT bins and "
+            f"are empty; use a larger nfft or fewer filters", RuntimeWarning)
+
+    blocks = []
+    for first in range(0, n_mels, _FILTERS_PER_BLOCK):
+        block = weights[first:first + _FILTERS_PER_BLOCK]
+        nonzero = np.flatnonzero(block.any(axis=0))
+        start, stop = (nonzero[0], nonzero[-1] + 1) if len(nonzero) else (0, 0)
+        dense = np.ascontiguousarray(block[:, start:stop])
+        dense.setflags(write=False)
+        blocks.append((first, int(start), dense))
+
+    centers = edges[1:-1].copy()
+    centers.setflags(write=False)
+    return MelFilterbank(tuple(blocks), centers, len(bins))
+
+
+def compute_mel_spectrogram(data, rate=44100, nfft=1024, hop=512, window="hann",
+                            n_mels=64, fmin=0.0, fmax=None, scale="mel",
+                            as_db=False):
+    """
+    Compute a mel (or log-frequency) spectrogram on top of
+    :func:`compute_spectrogram`.
+
+    ``data`` is a 1D signal, or an ``(n_clips, n_samples)`` array which is
+    transformed with :func:`compute_spectrogram_batch`. The filterbank comes
+    from :func:`mel_filterbank`, so it is built once per
+    ``(rate, nfft, n_mels, fmin, fmax, scale)``. The default ``nfft`` is
+    larger than the STFT's so the narrow low filters still cover a bin.
+
+    Returns:
+        (mel_power, centers, times) with mel_power of shape (..., n_mels,
+        len(times)), in decibels when ``as_db`` is true, and the filter
+        center frequencies in Hz
+    """
+    filterbank = mel_filterbank(rate, nfft, n_mels, fmin, fmax, scale)
+
+    if np.ndim(data) == 2:
+        power, _, times = compute_spectrogram_batch(
+            data, rate=rate, nfft=nfft, hop=hop, window=window)
+    else:
+        power, _, times = compute_spectrogram(
+            data, rate=rate, nfft=nfft, hop=hop, window=window)
+
+    mel_power = filterbank.apply(power)
+    if as_db:
+        mel_power = _power_to_db(mel_power)
+    return mel_power, filterbank.centers, times
@@ -0,0 +1,162 @@
+import threading
+import time
+import warnings
+from contextlib import contextmanager, nullcontext
+from typing import Dict, NamedTuple
+
+_SINKS: tuple = ()
+_LOCK = threading.Lock()
+_NULL_SPAN = nullcontext()
+
+
+class MetricsSink:
+    """
+    Receiver for timing spans and counters emitted by the library.
+
+    Subclass and override :meth:`span` and/or :meth:`count`, then register
+    the sink with :func:`add_metrics_sink` or use it as a context manager.
+    Spans are named ``decode``, ``stft``, ``render``, ``encode``, ``write``
+    and ``record``; counters include ``bytes_read``, ``files_processed``,
+    ``files_failed``, ``cache_hits``, ``cache_misses`` and ``dropped_frames``.
+    Both methods may be called from worker and audio threads, so
+    implementations must be thread-safe and quick.
+    """
+
+    def span(self, name: str, seconds: float, tags: Dict[str, object]):
+        """Called when a timed stage finishes."""
+
+    def count(self, name: str, value: int, tags: Dict[str, object]):
+        """Called when a counter is incremented."""
+
+    def __enter__(self):
+        add_metrics_sink(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        remove_metrics_sink(self)
+
+
+class SpanStats(NamedTuple):
+    count: int
+    total: float
+    max: float
+
+
+class MetricsCollector(MetricsSink):
+    """In-memory sink that aggregates span timings and counter totals by name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans: Dict[str, SpanStats] = {}
+        self.counters: Dict[str, int] = {}
+
+    def span(self, name, seconds, tags):
+        with self._lock:
+            count, total, longest = self.spans.get(name, (0, 0.0, 0.0))
+            self.spans[name] = SpanStats(count + 1, total + seconds, max(longest, seconds))
+
+    def count(self, name, value, tags):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self.spans.clear()
+            self.counters.clear()
+
+
+def add_metrics_sink(sink: MetricsSink) -> MetricsSink:
+    """Start sending spans and counters to ``sink``."""
+    global _SINKS
+    with _LOCK:
+        if sink not in _SINKS:
+            _SINKS = _SINKS + (sink,)
+    return sink
+
+
+def remove_metrics_sink(sink: MetricsSink):
+    """Stop sending spans and counters to ``sink``."""
+    global _SINKS
+    with _LOCK:
+        _SINKS = tuple(s for s in _SINKS if s is not sink)
+
+
+def enabled() -> bool:
+    """True when at least one sink is registered."""
+    return bool(_SINKS)
+
+
+def _emit(kind: str, name: str, value, tags: dict):
+    for sink in _SINKS:
+        try:
+            getattr(sink, kind)(name, value, tags)
+        except Exception as exc:
+            warnings.warn(f"Metrics sink {sink!r} failed: {exc}", RuntimeWarning)
+
+
+class _Span:
+    __slots__ = ("name", "tags", "start")
+
+    def __init__(self, name: str, tags: dict):
+        self.name = name
+        self.tags = tags
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.tags["error"] = exc_type.__name__
+        _emit("span", self.name, seconds, self.tags)
+
+
+def timed(name: str, **tags):
+    """
+    Context manager that reports its duration as span ``name``. With no
+    sinks registered it returns a shared no-op context.
+    """
+    if not _SINKS:
+        return _NULL_SPAN
+    return _Span(name, tags)
+
+
+def count(name: str, value: int = 1, **tags):
+    """Increment counter ``name`` by ``value``."""
+    if _SINKS:
+        _emit("count", name, value, tags)
+
+
+class _EventLog(MetricsSink):
+    def __init__(self):
+        self.events = []
+
+    def span(self, name, seconds, tags):
+        self.events.append(("span", name, seconds, tags))
+
+    def count(self, name, value, tags):
+        self.events.append(("count", name, value, tags))
+
+
+@contextmanager
+def recording():
+    """
+    Capture events into a list instead of the registered sinks, for worker
+    processes whose events are sent back and passed to :func:`replay`. Only
+    use it where no other thread emits metrics.
+    """
+    global _SINKS
+    log = _EventLog()
+    previous, _SINKS = _SINKS, (log,)
+    try:
+        yield log.events
+    finally:
+        _SINKS = previous
+
+
+def replay(events):
+    """Deliver events captured by :func:`recording` to the registered sinks."""
+    if _SINKS:
+        for kind, name, value, tags in events:
+            _emit(kind, name, value, tags)
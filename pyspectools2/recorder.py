@@ -0,0 +1,307 @@
+import threading
+import time
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+from . import metrics
+
+
+class RingBuffer:
+    """
+    Single-producer, single-consumer ring buffer of audio frames.
+
+    The producer (an audio callback) only advances the write position and the
+    consumer only advances the read position, so neither side takes a lock.
+    When the consumer falls a full buffer behind, incoming blocks are dropped
+    and counted as overruns rather than overwriting unread audio.
+    """
+
+    def __init__(self, capacity: int, channels: int = 1, dtype="float32"):
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity = capacity
+        self.channels = channels
+        self._data = np.zeros((capacity, channels), dtype=dtype)
+        self._write_pos = 0
+        self._read_pos = 0
+        self._data_ready = threading.Event()
+        self.closed = False
+        self.overruns = 0
+        self.dropped_frames = 0
+
+    @property
+    def available(self) -> int:
+        """Number of written frames not yet consumed."""
+        return self._write_pos - self._read_pos
+
+    def write(self, block: np.ndarray) -> bool:
+        """Append a (frames, channels) block. Returns False if it was dropped."""
+        frames = len(block)
+        if self.available + frames > self.capacity:
+            self.overruns += 1
+            self.dropped_frames += frames
+            self._data_ready.set()
+            return False
+
+        start = self._write_pos % self.capacity
+        first = min(frames, self.capacity - start)
+        self._data[start:start + first] = block[:first]
+        self._data[:frames - first] = block[first:]
+
+        self._write_pos += frames
+        self._data_ready.set()
+        return True
+
+    def close(self):
+        """Wake up a blocked reader; further reads drain what is left."""
+        self.closed = True
+        self._data_ready.set()
+
+    def read(self, frames: int, advance: Optional[int] = None,
+             timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Copy out the next ``frames`` frames and move the read position by
+        ``advance`` (defaults to ``frames``; smaller values overlap chunks).
+
+        Blocks until enough audio is available. Returns None on timeout, or
+        once the buffer is closed and too little audio is left.
+        """
+        if advance is None:
+            advance = frames
+        if not 0 < advance <= frames <= self.capacity:
+            raise ValueError("need 0 < advance <= frames <= capacity")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.available < frames:
+            if self.closed:
+                return None
+            self._data_ready.clear()
+            if self.available >= frames or self.closed:
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            self._data_ready.wait(remaining)
+
+        start = self._read_pos % self.capacity
+        first = min(frames, self.capacity - start)
+        out = np.empty((frames, self.channels), dtype=self._data.dtype)
+        out[:first] = self._data[start:start + first]
+        out[first:] = self._data[:frames - first]
+
+        self._read_pos += advance
+        return out
+
+
+class ContinuousRecorder:
+    """
+    Gapless recorder built on a ``sounddevice.InputStream`` callback.
+
+    Audio is captured into a :class:`RingBuffer` while the consumer processes
+    earlier chunks, so nothing is lost between chunks as long as the consumer
+    keeps up on average. ``stream_factory`` defaults to ``sd.InputStream`` and
+    can be replaced by a fake stream for testing.
+    """
+
+    def __init__(self, rate=44100, channels=1, buffer_seconds=30.0, blocksize=0,
+                 stream_factory: Optional[Callable] = None):
+        self.rate = rate
+        self.channels = channels
+        self.blocksize = blocksize
+        self.buffer = RingBuffer(int(rate * buffer_seconds), channels=channels)
+        self.status_overflows = 0
+        self._stream_factory = stream_factory
+        self._stream = None
+
+    def _callback(self, indata, frames, time_info, status):
+        if status and getattr(status, "input_overflow", False):
+            self.status_overflows += 1
+        if not self.buffer.write(indata):
+            metrics.count("dropped_frames", frames)
+
+    @property
+    def overruns(self) -> int:
+        """Ring buffer overruns plus overflows reported by the audio device."""
+        return self.buffer.overruns + self.status_overflows
+
+    def start(self):
+        if self._stream is not None:
+            return
+        factory = self._stream_factory
+        if factory is None:
+            import sounddevice as sd
+            factory = sd.InputStream
+
+        self.buffer.closed = False
+        self._stream = factory(samplerate=self.rate, channels=self.channels,
+                               blocksize=self.blocksize, dtype="float32",
+                               callback=self._callback)
+        self._stream.start()
+
+    def stop(self):
+        if self._stream is None:
+            return
+        self._stream.stop()
+        self._stream.close()
+        self._stream = None
+        self.buffer.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def read(self, duration: float, overlap: float = 0.0,
+             timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Return the next ``duration`` seconds of audio, keeping the last
+        ``overlap`` seconds for the following chunk. Mono audio is flattened
+        like :func:`record_audio`. Returns None on timeout.
+        """
+        frames = int(round(duration * self.rate))
+        advance = frames - int(round(overlap * self.rate))
+        chunk = self.buffer.read(frames, advance=advance, timeout=timeout)
+        if chunk is None or self.channels > 1:
+            return chunk
+        return chunk.reshape(-1)
+
+    def chunks(self, duration: float, overlap: float = 0.0,
+               timeout: Optional[float] = None) -> Iterator[np.ndarray]:
+        """Yield consecutive chunks until the recorder stops or a read times out."""
+        while True:
+            chunk = self.read(duration, overlap=overlap, timeout=timeout)
+            if chunk is None:
+                return
+            yield chunk
+
+
+class RollingSpectrogram:
+    """
+    Fixed-width spectrogram that is extended incrementally as audio arrives.
+
+    :meth:`push` only transforms the frames completed by the new samples and
+    writes them into a circular ``(freq, width)`` column buffer, so the cost
+    of an update depends on the number of new samples, never on the history.
+    """
+
+    def __init__(self, rate=44100, nfft=256, hop=128, window="hann", width=1024):
+        from .spectrogram import _PLAN_CACHE
+
+        if nfft <= 0 or hop <= 0 or width <= 0:
+            raise ValueError("nfft, hop and width must be positive integers")
+        self.rate = rate
+        self.nfft = nfft
+        self.hop = hop
+        self.width = width
+        self._plan = _PLAN_CACHE.get(nfft, hop, window, rate, nfft)
+        self._columns = np.zeros((nfft // 2 + 1, width))
+        self._pending = np.zeros(0, dtype=np.float32)
+        self.total_columns = 0
+        self._figure = None
+
+    @property
+    def freqs(self) -> np.ndarray:
+        return self._plan.freqs
+
+    @property
+    def filled(self) -> int:
+        """Number of valid columns currently held, at most ``width``."""
+        return min(self.total_columns, self.width)
+
+    def push(self, samples: np.ndarray) -> int:
+        """Add new mono samples and return how many columns were produced."""
+        from .spectrogram import _frames_to_power
+
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        buffered = np.concatenate([self._pending, samples])
+        if len(buffered) < self.nfft:
+            self._pending = buffered
+            return 0
+
+        frames = np.lib.stride_tricks.sliding_window_view(
+            buffered, self.nfft)[::self.hop]
+        # Only the newest `width` columns can ever be visible.
+        frames = frames[-self.width:] if len(frames) > self.width else frames
+        n_new = (len(buffered) - self.nfft) // self.hop + 1
+
+        power = _frames_to_power(frames, self._plan)
+        start = (self.total_columns + n_new - len(frames)) % self.width
+        first = min(len(frames), self.width - start)
+        self._columns[:, start:start + first] = power[:, :first]
+        self._columns[:, :len(frames) - first] = power[:, first:]
+
+        self.total_columns += n_new
+        self._pending = buffered[n_new * self.hop:].copy()
+        return n_new
+
+    @property
+    def power(self) -> np.ndarray:
+        """The held columns in chronological order, shape (freq, filled)."""
+        if self.total_columns <= self.width:
+            return self._columns[:, :self.total_columns].copy()
+        head = self.total_columns % self.width
+        return np.concatenate(
+            [self._columns[:, head:], self._columns[:, :head]], axis=1)
+
+    @property
+    def times(self) -> np.ndarray:
+        """Absolute time in seconds of each column returned by :attr:`power`."""
+        first = self.total_columns - self.filled
+        index = np.arange(first, self.total_columns)
+        return (index * self.hop + self.nfft / 2) / self.rate
+
+    def follow(self, recorder: "ContinuousRecorder", hops_per_update: int = 1,
+               timeout: Optional[float] = None) -> Iterator[int]:
+        """
+        Feed audio from a running :class:`ContinuousRecorder` and yield the
+        number of new columns after each update of ``hops_per_update`` hops.
+        Stops when the recorder stops or a read times out.
+        """
+        frames = self.hop * hops_per_update
+        while True:
+            chunk = recorder.buffer.read(frames, timeout=timeout)
+            if chunk is None:
+                return
+            mono = chunk[:, 0] if chunk.shape[1] == 1 else chunk.mean(axis=1)
+            yield self.push(mono)
+
+    def plot(self):
+        """
+        Draw the current columns, reusing the same Figure and image on later
+        calls so only the pixel data is updated.
+
+        Returns:
+            (fig, ax)
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
+        from .spectrogram import _db_limits, _power_to_db
+
+        db = _power_to_db(self.power)
+        vmin, vmax = _db_limits(db)
+        times = self.times
+        extent = (times[0] if len(times) else 0.0,
+                  times[-1] if len(times) else 0.0,
+                  self.freqs[0], self.freqs[-1])
+
+        if self._figure is None:
+            fig = Figure(figsize=(10, 6), dpi=100)
+            FigureCanvas(fig)
+            ax = fig.add_subplot(111)
+            image = ax.imshow(db, cmap='viridis', origin='lower', aspect='auto',
+                              extent=extent, interpolation='nearest', vmin=vmin, vmax=vmax)
+            ax.set_xlabel('Time (s)')
+            ax.set_ylabel('Frequency (Hz)')
+            ax.set_title('Spectrogram')
+            self._figure = (fig, ax, image)
+        else:
+            fig, ax, image = self._figure
+            image.set_data(db)
+            image.set_extent(extent)
+            image.set_clim(vmin, vmax)
+
+        return fig, ax
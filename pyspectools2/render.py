@@ -0,0 +1,148 @@
+import struct
+import zlib
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from . import metrics
+from .spectrogram import _db_limits, _power_to_db
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_COLOR_RGB = 2
+_PNG_COLOR_PALETTE = 3
+
+
+@lru_cache(maxsize=16)
+def colormap_lut(cmap: str = "viridis") -> np.ndarray:
+    """
+    Return a read-only (256, 3) uint8 RGB lookup table for a matplotlib colormap.
+
+    The table is built once per colormap name; rendering only indexes into it.
+    """
+    from matplotlib import colormaps
+
+    rgba = colormaps[cmap](np.linspace(0.0, 1.0, 256))
+    lut = np.round(rgba[:, :3] * 255).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+def _png_chunk(tag: bytes, payload: bytes) -> bytes:
+    crc = zlib.crc32(payload, zlib.crc32(tag)) & 0xFFFFFFFF
+    return struct.pack(">I", len(payload)) + tag + payload + struct.pack(">I", crc)
+
+
+def write_png(path: str, image: np.ndarray, palette: Optional[np.ndarray] = None,
+              compress_level: int = 6):
+    """
+    Write a uint8 image as a PNG file.
+
+    ``image`` is either (height, width, 3) RGB, or (height, width) palette
+    indices together with a (256, 3) ``palette``.
+    """
+    image = np.asarray(image, dtype=np.uint8)
+    if palette is not None and image.ndim == 2:
+        color_type = _PNG_COLOR_PALETTE
+        height, width = image.shape
+        row_bytes = width
+    elif palette is None and image.ndim == 3 and image.shape[2] == 3:
+        color_type = _PNG_COLOR_RGB
+        height, width, _ = image.shape
+        row_bytes = width * 3
+    else:
+        raise ValueError(
+            "write_png expects (height, width, 3) RGB data or (height, width) "
+            "indices with a palette")
+
+    # Every scanline starts with filter type 0 (None).
+    raw = np.zeros((height, row_bytes + 1), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, row_bytes)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    with metrics.timed("encode", format="png"):
+        chunks = [_PNG_SIGNATURE, _png_chunk(b"IHDR", header)]
+        if palette is not None:
+            chunks.append(_png_chunk(b"PLTE", np.asarray(palette, dtype=np.uint8).tobytes()))
+        chunks.append(_png_chunk(b"IDAT", zlib.compress(raw.tobytes(), compress_level)))
+        chunks.append(_png_chunk(b"IEND", b""))
+
+    with metrics.timed("write", format="png"), open(path, "wb") as f:
+        f.writelines(chunks)
+
+
+def spectrogram_to_indices(power: np.ndarray, vmin: Optional[float] = None,
+                           vmax: Optional[float] = None) -> np.ndarray:
+    """
+    Map a (freq, time) power array to uint8 colormap indices with low
+    frequencies in the bottom row, using the same dB scaling and autoscaling
+    as :func:`plot_spectrogram`: limits default to the range of the bins
+    with nonzero power, and silent bins take the lowest index.
+    """
+    db = _power_to_db(np.asarray(power))
+    auto_lo, auto_hi = _db_limits(db) if vmin is None or vmax is None else (vmin, vmax)
+    lo = auto_lo if vmin is None else vmin
+    hi = auto_hi if vmax is None else vmax
+    span = hi - lo if hi > lo else 1.0
+
+    db -= lo
+    db *= 255.0 / span
+    np.clip(db, 0, 255, out=db)
+    return db[::-1].astype(np.uint8)
+
+
+def spectrogram_to_rgb(power: np.ndarray, cmap: str = "viridis",
+                       vmin: Optional[float] = None,
+                       vmax: Optional[float] = None) -> np.ndarray:
+    """Map a (freq, time) power array to a (freq, time, 3) uint8 RGB image."""
+    return colormap_lut(cmap)[spectrogram_to_indices(power, vmin=vmin, vmax=vmax)]
+
+
+def render_spectrogram_image(power: np.ndarray, path: str,
+                             cmap: str = "viridis",
+                             vmin: Optional[float] = None,
+                             vmax: Optional[float] = None,
+                             decorate: bool = False,
+                             freqs: Optional[np.ndarray] = None,
+                             times: Optional[np.ndarray] = None,
+                             compress_level: int = 6) -> str:
+    """
+    Render a power spectrogram straight to a PNG file, without a Figure.
+
+    One pixel is drawn per (frequency, time) bin and the colormap lookup
+    table is stored as the PNG palette, so encoding touches one byte per bin.
+    ``decorate=True`` adds axes, labels and title through matplotlib instead,
+    which is much slower; ``freqs`` and ``times`` then set the axis ranges.
+
+    Returns:
+        the path of the written PNG
+    """
+    if decorate:
+        with metrics.timed("render"):
+            rgb = spectrogram_to_rgb(power, cmap=cmap, vmin=vmin, vmax=vmax)
+        _save_decorated(rgb, path, freqs, times)
+    else:
+        with metrics.timed("render"):
+            indices = spectrogram_to_indices(power, vmin=vmin, vmax=vmax)
+        write_png(path, indices, palette=colormap_lut(cmap),
+                  compress_level=compress_level)
+    return path
+
+
+def _save_decorated(rgb: np.ndarray, path: str, freqs, times):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+    from matplotlib.figure import Figure
+
+    extent = None
+    if freqs is not None and times is not None:
+        extent = (times[0], times[-1], freqs[0], freqs[-1])
+
+    fig = Figure(figsize=(10, 6), dpi=100)
+    FigureCanvas(fig)
+    ax = fig.add_subplot(111)
+    ax.imshow(rgb, aspect="auto", extent=extent, interpolation="nearest")
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Frequency (Hz)')
+    ax.set_title('Spectrogram')
+    with metrics.timed("encode", format="png"):
+        fig.savefig(path)
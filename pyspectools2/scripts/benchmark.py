@@ -0,0 +1,258 @@
+"""
+Benchmarks for the load, STFT, render, save and batch hot paths.
+
+Runs offline on synthetic WAV files across a matrix of durations, sample
+rates and channel counts, and reports throughput (audio seconds processed
+per wall-clock second), latency percentiles and peak traced memory for each
+stage. Results are written as JSON so runs can be compared:
+
+    python -m pyspectools2.scripts.benchmark --output before.json
+    python -m pyspectools2.scripts.benchmark --output after.json --compare before.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import soundfile as sf
+
+STAGES = ("load", "stft", "render", "save", "batch")
+BATCH_FILES = 8
+
+
+def synthetic_wav(path: str, duration: float, rate: int, channels: int = 1,
+                  seed: int = 0) -> str:
+    """Write a 16-bit WAV of a linear chirp plus noise, one phase per channel."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration * rate)) / rate
+    sweep = 2 * np.pi * (200 * t + (rate / 8) * t ** 2 / max(duration, 1e-9))
+    audio = np.stack([0.5 * np.sin(sweep + channel) for channel in range(channels)], axis=1)
+    audio += 0.05 * rng.standard_normal(audio.shape)
+    sf.write(path, audio, rate, subtype="PCM_16")
+    return path
+
+
+def _percentile_summary(samples: Sequence[float]) -> Dict[str, float]:
+    values = np.asarray(samples, dtype=np.float64)
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {
+        "mean": float(values.mean()),
+        "min": float(values.min()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(values.max()),
+    }
+
+
+def _measure(func: Callable, repeats: int, setup: Optional[Callable] = None):
+    """
+    Time ``repeats`` calls of ``func(*setup())`` and trace one extra call's
+    peak allocation. ``setup`` runs outside the timed region.
+    """
+    setup = setup or tuple
+    samples = []
+    for _ in range(repeats):
+        args = setup()
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+
+    args = setup()
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return samples, peak
+
+
+def _stage_case(stage: str, path: str, workdir: str, nfft: int, hop: int,
+                workers: Optional[int]):
+    """Return ``(func, setup, audio_seconds_per_call)`` for one stage."""
+    from .. import spectrogram
+
+    data, rate = spectrogram.load_wav(path)
+    seconds = len(data) / rate
+
+    if stage == "load":
+        return (lambda: spectrogram.load_wav(path)), None, seconds
+    if stage == "stft":
+        return (lambda: spectrogram.compute_spectrogram(data, rate=rate, nfft=nfft, hop=hop)), \
+            None, seconds
+    if stage == "render":
+        def render():
+            fig, _ = spectrogram.plot_spectrogram(data, rate=rate, nfft=nfft, hop=hop)
+            fig.canvas.draw()
+            spectrogram._close_figure(fig)
+        return render, None, seconds
+    if stage == "save":
+        session_folder = os.path.join(workdir, "save")
+        os.makedirs(session_folder, exist_ok=True)
+
+        def figure():
+            fig, _ = spectrogram.plot_spectrogram(data, rate=rate, nfft=nfft, hop=hop)
+            return fig, session_folder
+        return spectrogram.save_spectrogram, figure, seconds
+    if stage == "batch":
+        batch_dir = os.path.join(workdir, "batch")
+        os.makedirs(batch_dir, exist_ok=True)
+        for index in range(BATCH_FILES):
+            sf.write(os.path.join(batch_dir, f"clip_{index:03d}.wav"), data, rate,
+                     subtype="PCM_16")
+
+        def batch():
+            with contextlib.redirect_stdout(io.StringIO()):
+                spectrogram.batch_process_wavs(
+                    batch_dir, workers=workers,
+                    output_directory=os.path.join(workdir, "sessions"))
+        return batch, None, seconds * BATCH_FILES
+    raise ValueError(f"Unknown stage '{stage}'. Expected one of: {', '.join(STAGES)}")
+
+
+def run_benchmarks(durations: Sequence[float] = (1.0, 10.0),
+                   rates: Sequence[int] = (16000, 44100),
+                   channels: Sequence[int] = (1, 2),
+                   stages: Sequence[str] = STAGES,
+                   repeats: int = 5, nfft: int = 256, hop: int = 128,
+                   workers: Optional[int] = None) -> List[dict]:
+    """Run every stage over the duration x rate x channel matrix."""
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stage(s) {sorted(unknown)}. Expected: {', '.join(STAGES)}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for duration in durations:
+            for rate in rates:
+                for n_channels in channels:
+                    case_dir = os.path.join(workdir, f"{duration}s_{rate}hz_{n_channels}ch")
+                    os.makedirs(case_dir)
+                    path = synthetic_wav(os.path.join(case_dir, "input.wav"),
+                                         duration, rate, n_channels)
+                    for stage in stages:
+                        func, setup, seconds = _stage_case(
+                            stage, path, case_dir, nfft, hop, workers)
+                        samples, peak = _measure(func, repeats, setup)
+                        results.append({
+                            "stage": stage,
+                            "duration": duration,
+                            "rate": rate,
+                            "channels": n_channels,
+                            "repeats": repeats,
+                            "audio_seconds": seconds,
+                            "throughput": seconds / float(np.median(samples)),
+                            "latency": _percentile_summary(samples),
+                            "peak_memory_bytes": peak,
+                        })
+    return results
+
+
+def _environment() -> dict:
+    from .. import __version__
+
+    return {
+        "pyspectools2": __version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _case_key(result: dict):
+    return result["stage"], result["duration"], result["rate"], result["channels"]
+
+
+def compare_results(baseline: List[dict], current: List[dict]) -> List[dict]:
+    """
+    Pair up matching cases and report ``current / baseline`` throughput
+    ratios; values below 1 mean the current run is slower.
+    """
+    previous = {_case_key(result): result for result in baseline}
+    rows = []
+    for result in current:
+        before = previous.get(_case_key(result))
+        if before is None:
+            continue
+        rows.append({
+            "stage": result["stage"],
+            "duration": result["duration"],
+            "rate": result["rate"],
+            "channels": result["channels"],
+            "baseline_throughput": before["throughput"],
+            "throughput": result["throughput"],
+            "ratio": result["throughput"] / before["throughput"],
+        })
+    return rows
+
+
+def _format_table(results: List[dict]) -> str:
+    lines = [f"{'stage':<8}{'dur(s)':>8}{'rate':>8}{'ch':>4}"
+             f"{'x realtime':>12}{'p50 ms':>10}{'p99 ms':>10}{'peak MiB':>10}"]
+    for r in results:
+        lines.append(
+            f"{r['stage']:<8}{r['duration']:>8g}{r['rate']:>8}{r['channels']:>4}"
+            f"{r['throughput']:>12.1f}{r['latency']['p50'] * 1e3:>10.2f}"
+            f"{r['latency']['p99'] * 1e3:>10.2f}{r['peak_memory_bytes'] / 2 ** 20:>10.2f}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--durations", type=float, nargs="+", default=[1.0, 10.0])
+    parser.add_argument("--rates", type=int, nargs="+", default=[16000, 44100])
+    parser.add_argument("--channels", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--nfft", type=int, default=256)
+    parser.add_argument("--hop", type=int, default=128)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="process pool size for the batch stage")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="compare throughput against a previous JSON result")
+    parser.add_argument("--threshold", type=float, default=0.9,
+                        help="with --compare, exit 1 if any ratio falls below this")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.durations, args.rates, args.channels, args.stages,
+                             repeats=args.repeats, nfft=args.nfft, hop=args.hop,
+                             workers=args.workers)
+    print(_format_table(results))
+
+    if args.output:
+        report = {"created": time.time(), "environment": _environment(),
+                  "parameters": {"nfft": args.nfft, "hop": args.hop,
+                                 "workers": args.workers},
+                  "results": results}
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        rows = compare_results(baseline, results)
+        regressions = [row for row in rows if row["ratio"] < args.threshold]
+        for row in rows:
+            flag = "  SLOWER" if row in regressions else ""
+            print(f"{row['stage']:<8}{row['duration']:>8g}{row['rate']:>8}"
+                  f"{row['channels']:>4}  x{row['ratio']:.2f}{flag}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+import math
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+from .spectrogram import load_wav
+
+
+class ActiveSegment(NamedTuple):
+    start: float
+    stop: float
+    audio: np.ndarray
+
+
+def frame_rms(data: np.ndarray, frame_length: int = 1024, hop: int = 512) -> np.ndarray:
+    """
+    RMS energy of every full frame of ``data``, of shape (frames,) or
+    (frames, channels); channels are pooled into one value per frame.
+
+    Frames are strided views into ``data`` reduced with ``einsum``, so no
+    squared or framed copy of the signal is made.
+    """
+    if frame_length <= 0 or hop <= 0:
+        raise ValueError("frame_length and hop must be positive integers")
+    data = np.asarray(data)
+    if not np.issubdtype(data.dtype, np.floating):
+        data = data.astype(np.float32)
+    if len(data) < frame_length:
+        return np.empty(0, dtype=data.dtype)
+
+    windows = np.lib.stride_tricks.sliding_window_view(data, frame_length, axis=0)[::hop]
+    if data.ndim == 1:
+        energy = np.einsum("fl,fl->f", windows, windows)
+    else:
+        energy = np.einsum("fcl,fcl->f", windows, windows)
+    return np.sqrt(energy / (frame_length * (data.size // len(data))))
+
+
+def _hysteresis(rms: np.ndarray, threshold: float, release: float, initial: bool) -> np.ndarray:
+    """
+    Per-frame activity: frames above ``threshold`` switch on, frames below
+    ``release`` switch off, and frames in between keep the previous state.
+    """
+    above = rms > threshold
+    decided = above | (rms < release)
+    last = np.where(decided, np.arange(len(rms)), -1)
+    np.maximum.accumulate(last, out=last)
+    return np.where(last >= 0, above[last], initial)
+
+
+class Segmenter:
+    """
+    Streaming voice/silence segmentation by frame RMS energy.
+
+    Feed consecutive blocks of shape (frames,) or (frames, channels) to
+    :meth:`process` and call :meth:`flush` at the end; each call returns the
+    ``(start, stop)`` sample ranges of the active intervals it completed.
+
+    A frame turns active when its RMS exceeds ``threshold`` and stays active
+    until the RMS drops below ``release`` (default ``threshold / 2``).
+    Silent gaps shorter than ``min_silence`` seconds are bridged, then active
+    intervals whose signal lasts less than ``min_active`` seconds are
+    dropped; the returned ranges still span every active frame. Only the
+    unframed tail of the input is kept between blocks.
+    """
+
+    def __init__(self, rate: int, threshold: float = 0.01, release: Optional[float] = None,
+                 frame_length: int = 1024, hop: int = 512, min_active: float = 0.1,
+                 min_silence: float = 0.3):
+        release = threshold / 2 if release is None else release
+        if not 0 <= release <= threshold:
+            raise ValueError("Expected 0 <= release <= threshold")
+        if frame_length <= 0 or hop <= 0:
+            raise ValueError("frame_length and hop must be positive integers")
+
+        self.rate = rate
+        self.threshold = threshold
+        self.release = release
+        self.frame_length = frame_length
+        self.hop = hop
+        self._min_active = min_active * rate
+        self._min_silence = math.ceil(min_silence * rate / hop)
+
+        self._buffer = None
+        self._consumed = 0
+        self._frames = 0
+        self._active = False
+        self._run_start = None
+        self._silence_start = None
+
+    def _bounds(self, first: int, end: int) -> Tuple[int, int]:
+        """Sample range covered by frames ``[first, end)``."""
+        return first * self.hop, min((end - 1) * self.hop + self.frame_length, self._consumed)
+
+    def _duration(self, first: int, end: int) -> int:
+        """
+        Samples of signal behind active frames ``[first, end)``. A burst
+        also lights up every frame that only overlaps it, so the
+        ``frame_length - hop`` samples of overlap are not counted.
+        """
+        return max((end - first) * self.hop - (self.frame_length - self.hop), 0)
+
+    def _close(self, end: int, intervals: List[Tuple[int, int]]):
+        if self._duration(self._run_start, end) >= self._min_active:
+            intervals.append(self._bounds(self._run_start, end))
+        self._run_start = self._silence_start = None
+
+    def _advance(self, rms: np.ndarray) -> List[Tuple[int, int]]:
+        """Run the hysteresis and duration rules over the next frames."""
+        intervals = []
+        if not len(rms):
+            return intervals
+
+        state = _hysteresis(rms, self.threshold, self.release, self._active)
+        changes = np.flatnonzero(state != np.concatenate(([self._active], state[:-1])))
+        for frame in (changes + self._frames).tolist():
+            if self._run_start is None or self._silence_start is None:
+                if self._run_start is None:
+                    self._run_start = frame
+                else:
+                    self._silence_start = frame
+            elif frame - self._silence_start < self._min_silence:
+                self._silence_start = None
+            else:
+                self._close(self._silence_start, intervals)
+                self._run_start = frame
+
+        self._frames += len(rms)
+        self._active = bool(state[-1])
+        if self._silence_start is not None and \
+                self._frames - self._silence_start >= self._min_silence:
+            self._close(self._silence_start, intervals)
+        return intervals
+
+    def process(self, block: np.ndarray) -> List[Tuple[int, int]]:
+        """Segment the next block and return every interval it completes."""
+        block = np.asarray(block)
+        if self._buffer is None:
+            self._buffer = block[:0]
+        elif block.shape[1:] != self._buffer.shape[1:]:
+            raise ValueError("All blocks must have the same number of channels")
+
+        self._buffer = np.concatenate([self._buffer, block])
+        self._consumed += len(block)
+
+        rms = frame_rms(self._buffer, self.frame_length, self.hop)
+        self._buffer = self._buffer[len(rms) * self.hop:]
+        return self._advance(rms)
+
+    def flush(self) -> List[Tuple[int, int]]:
+        """Score the final partial frame and close any open interval."""
+        intervals = []
+        covered = (self._frames - 1) * self.hop + self.frame_length if self._frames else 0
+        if self._consumed > covered:
+            tail = self._buffer.astype(np.float64)
+            intervals = self._advance(np.array([np.sqrt(np.mean(tail * tail))]))
+        if self._run_start is not None:
+            end = self._frames if self._silence_start is None else self._silence_start
+            self._close(end, intervals)
+        return intervals
+
+
+def segment_audio(data: np.ndarray, rate: int, **kwargs) -> np.ndarray:
+    """
+    Active intervals of an in-memory signal as an ``(n, 2)`` array of
+    ``[start, stop)`` sample indices. Keyword arguments go to
+    :class:`Segmenter`.
+    """
+    segmenter = Segmenter(rate, **kwargs)
+    intervals = segmenter.process(data) + segmenter.flush()
+    return np.array(intervals, dtype=np.int64).reshape(-1, 2)
+
+
+def remove_silence(data: np.ndarray, rate: int, **kwargs) -> np.ndarray:
+    """Concatenate the active intervals of ``data``; see :func:`segment_audio`."""
+    data = np.asarray(data)
+    intervals = segment_audio(data, rate, **kwargs)
+    if not len(intervals):
+        return data[:0]
+    return np.concatenate([data[start:stop] for start, stop in intervals])
+
+
+def _iter_intervals(path: str, blocksize: int, kwargs: dict) -> Iterator[Tuple[int, int]]:
+    info = sf.info(path)
+    segmenter = Segmenter(info.samplerate, **kwargs)
+    for block in sf.blocks(path, blocksize=blocksize, dtype="float32", always_2d=True):
+        yield from segmenter.process(block)
+    yield from segmenter.flush()
+
+
+def segment_wav(path: str, blocksize: int = 65536, **kwargs) -> Tuple[np.ndarray, int]:
+    """
+    Streaming :func:`segment_audio` for sound files of any size.
+
+    Returns:
+        (intervals, samplerate) with intervals as an ``(n, 2)`` array of
+        sample indices
+    """
+    intervals = list(_iter_intervals(path, blocksize, kwargs))
+    return np.array(intervals, dtype=np.int64).reshape(-1, 2), sf.info(path).samplerate
+
+
+def iter_active_segments(path: str, blocksize: int = 65536, mono: bool = True,
+                         **kwargs) -> Iterator[ActiveSegment]:
+    """
+    Yield each active interval of a sound file as an
+    ``ActiveSegment(start, stop, audio)``, with times in seconds and
+    ``audio`` decoded as by :func:`load_wav`.
+
+    Each interval is read as soon as the segmenter completes it, so memory
+    holds one block plus one segment and silent stretches are never
+    decoded a second time or passed on to the STFT or renderer.
+    """
+    rate = sf.info(path).samplerate
+    for start, stop in _iter_intervals(path, blocksize, kwargs):
+        audio, _ = load_wav(path, start=start, stop=stop, unit="frames", mono=mono)
+        yield ActiveSegment(start / rate, stop / rate, audio)
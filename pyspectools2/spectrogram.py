@@ -2,38 +2,206 @@ import os
 import platform
 import re
 import shutil
+import sqlite3
+import struct
+import sys
+import threading
 import time
+import warnings
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import os
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
-import matplotlib.pyplot as plt
-import sounddevice as sd
 import numpy as np
 import soundfile as sf
-from typing import Tuple, List, Dict, Optional
+from typing import Iterator, NamedTuple, Tuple, List, Dict, Optional
+
+from . import metrics
+
+
+def __getattr__(name):
+    """
+    Import matplotlib and sounddevice on first use, so WAV and array
+    processing never pays for (or requires) them. ``spectrogram.plt``,
+    ``spectrogram.sd``, ``Figure`` and ``FigureCanvas`` remain available.
+    """
+    if name == "plt":
+        import matplotlib.pyplot as plt
+        return plt
+    if name == "sd":
+        import sounddevice as sd
+        return sd
+    if name == "Figure":
+        from matplotlib.figure import Figure
+        return Figure
+    if name == "FigureCanvas":
+        from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+        return FigureCanvas
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _close_figure(fig):
+    """
+    Release ``fig`` from pyplot. Figures built here never touch pyplot, so
+    it is only called when something else has already imported pyplot.
+    """
+    plt = sys.modules.get("matplotlib.pyplot")
+    if plt is not None:
+        plt.close(fig)
+
 
 _SESSION_PATTERN = re.compile(r"^session_(\d+)$")
 
+_WINDOWS = {
+    "hann": np.hanning,
+    "hanning": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+    "bartlett": np.bartlett,
+    "boxcar": np.ones,
+}
+
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_PCM_DTYPES = {
+    (_WAVE_FORMAT_PCM, 8): np.dtype("u1"),
+    (_WAVE_FORMAT_PCM, 16): np.dtype("<i2"),
+    (_WAVE_FORMAT_PCM, 32): np.dtype("<i4"),
+    (_WAVE_FORMAT_IEEE_FLOAT, 32): np.dtype("<f4"),
+    (_WAVE_FORMAT_IEEE_FLOAT, 64): np.dtype("<f8"),
+}
+
+
+def _parse_wav_layout(path: str) -> Tuple[int, int, int, int, np.dtype]:
+    """
+    Locate the sample data of an uncompressed WAV file.
+
+    Returns:
+        (data_offset, frames, channels, samplerate, sample_dtype)
+    """
+    with open(path, "rb") as f:
+        riff, _, wave = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or wave != b"WAVE":
+            raise ValueError(f"{path} is not a RIFF/WAVE file")
+
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"{path} has no data chunk")
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+
+            if chunk_id == b"fmt ":
+                body = f.read(chunk_size)
+                tag, channels, samplerate, _, _, bits = struct.unpack(
+                    "<HHIIHH", body[:16])
+                if tag == _WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                    tag = struct.unpack("<H", body[24:26])[0]
+                fmt = (tag, channels, samplerate, bits)
+                f.seek(chunk_size % 2, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError(f"{path} has data before its fmt chunk")
+                tag, channels, samplerate, bits = fmt
+                dtype = _PCM_DTYPES.get((tag, bits))
+                if dtype is None:
+                    raise ValueError(
+                        f"Cannot memory-map {bits}-bit WAV data with format tag {tag:#06x}")
+                frames = chunk_size // (dtype.itemsize * channels)
+                return f.tell(), frames, channels, samplerate, dtype
+            else:
+                f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+
+def _resolve_range(start, stop, unit: str, samplerate: int, frames: int) -> Tuple[int, int]:
+    """Convert a start/stop pair in seconds or frames into clamped frame indices."""
+    if unit == "seconds":
+        scale = samplerate
+    elif unit == "frames":
+        scale = 1
+    else:
+        raise ValueError(f"unit must be 'seconds' or 'frames', got '{unit}'")
+
+    first = 0 if start is None else int(round(start * scale))
+    last = frames if stop is None else int(round(stop * scale))
+    if first < 0 or last < 0:
+        raise ValueError("start and stop must be non-negative")
+
+    first = min(first, frames)
+    last = min(last, frames)
+    if first > last:
+        raise ValueError(f"start ({start}) is after stop ({stop})")
+    return first, last
+
+
+def _load_wav_mmap(path: str, start=None, stop=None, unit="seconds") -> Tuple[np.memmap, int]:
+    offset, frames, channels, sr, dtype = _parse_wav_layout(path)
+    data = np.memmap(path, dtype=dtype, mode="r", offset=offset,
+                     shape=(frames, channels))
+    if start is not None or stop is not None:
+        first, last = _resolve_range(start, stop, unit, sr, frames)
+        data = data[first:last]
+    return data, sr
 
-def load_wav(path: str) -> Tuple[np.ndarray, int]:
+
+def load_wav(path: str, mmap: bool = False, start=None, stop=None,
+             unit: str = "seconds", target_sr: Optional[int] = None,
+             mono: bool = True) -> Tuple[np.ndarray, int]:
     """
     Load WAV file and return mono float32 numpy array + samplerate.
+
+    With ``mono=False`` the channels are kept and a (frames, channels)
+    array is returned as decoded, without the downmix copy.
+
+    ``start``/``stop`` restrict the read to a range given in ``unit``
+    (``"seconds"`` or ``"frames"``) of the file; only that range is decoded.
+    With ``target_sr`` the audio is resampled with :func:`resample` and
+    ``target_sr`` is returned as the samplerate.
+
+    With ``mmap=True`` an uncompressed PCM or float WAV is not decoded at all:
+    a read-only ``numpy.memmap`` of shape (frames, channels) in the file's
+    native dtype is returned instead. Use :func:`pcm_to_float` on the slices
+    you need to get scaled float32 mono data.
     """
+    if mmap:
+        if target_sr is not None:
+            raise ValueError("target_sr cannot be combined with mmap=True")
+        return _load_wav_mmap(path, start=start, stop=stop, unit=unit)
 
-    with sf.SoundFile(path) as f:
-        data: np.ndarray = f.read(dtype="float32", always_2d=True)
+    with metrics.timed("decode"), sf.SoundFile(path) as f:
         sr: int = f.samplerate
+        if start is None and stop is None:
+            data: np.ndarray = f.read(dtype="float32", always_2d=True)
+        else:
+            first, last = _resolve_range(start, stop, unit, sr, f.frames)
+            f.seek(first)
+            data = f.read(last - first, dtype="float32", always_2d=True)
+        if metrics.enabled() and f.frames:
+            metrics.count("bytes_read", os.path.getsize(path) * len(data) // f.frames)
 
     # Convert stereo → mono if needed
-    if data.ndim == 2 and data.shape[1] > 1:
+    if not mono:
+        pass
+    elif data.ndim == 2 and data.shape[1] > 1:
         data = data.mean(axis=1)
     elif data.ndim == 2 and data.shape[1] == 1:
-        data = data.flatten()
+        data = data[:, 0]
+
+    if target_sr is not None and target_sr != sr:
+        from .resample import resample
+
+        data, sr = resample(data, sr, target_sr), target_sr
 
     return data, sr
 
 
+def _list_wav_files(directory: str) -> List[str]:
+    """Return the sorted names of WAV files directly inside ``directory``."""
+    return sorted(f for f in os.listdir(directory) if f.lower().endswith(".wav"))
+
+
 def load_wavs_from_directory(directory: str) -> Dict[str, Tuple[np.ndarray, int]]:
     """
     Load all WAV files from a directory.
@@ -43,33 +211,99 @@ def load_wavs_from_directory(directory: str) -> Dict[str, Tuple[np.ndarray, int]
     """
     wavs: Dict[str, Tuple[np.ndarray, int]] = {}
 
-    for file in os.listdir(directory):
-        if file.lower().endswith(".wav"):
-            path = os.path.join(directory, file)
-            wavs[file] = load_wav(path)
+    for file in _list_wav_files(directory):
+        path = os.path.join(directory, file)
+        wavs[file] = load_wav(path)
 
     return wavs
 
 
-def load_and_plot_wav(path, session=True):
+def iter_wavs_from_directory(directory: str, workers: int = 4, prefetch: int = 8,
+                             **load_kwargs) -> Iterator[Tuple[str, Tuple[np.ndarray, int]]]:
+    """
+    Lazily load WAV files from a directory, decoding ahead on a thread pool.
+
+    At most ``prefetch`` files are decoded ahead of the consumer, so only
+    ``prefetch + 1`` arrays are alive at any time. ``load_kwargs`` are passed
+    on to :func:`load_wav`.
+
+    Yields:
+        (filename, (audio_data, samplerate)) in sorted filename order
+    """
+    if workers <= 0 or prefetch <= 0:
+        raise ValueError("workers and prefetch must be positive integers")
+
+    files = iter(_list_wav_files(directory))
+    pending = deque()
+
+    def submit_next(executor):
+        file = next(files, None)
+        if file is not None:
+            path = os.path.join(directory, file)
+            pending.append((file, executor.submit(load_wav, path, **load_kwargs)))
+
+    executor = ThreadPoolExecutor(max_workers=workers,
+                                  thread_name_prefix="pyspectools2-load")
+    try:
+        for _ in range(prefetch):
+            submit_next(executor)
+
+        while pending:
+            file, future = pending.popleft()
+            result = future.result()
+            submit_next(executor)
+            yield file, result
+            del result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def load_and_plot_wav(path, session=True, start=None, stop=None, unit="seconds",
+                      cache=None, nfft=256, hop=128):
     """
     Load a wav file, plot its spectrogram, and optionally save it to a session.
+
+    ``start``/``stop``/``unit`` select a time range as in :func:`load_wav`;
+    the time axis of the plot stays relative to the start of the file.
+    With a :class:`SpectrogramCache`, decoding and the STFT are skipped for
+    files whose spectrogram is already cached, and the saved PNG is copied
+    from the cache instead of being drawn and encoded again.
     """
     from . import plot_spectrogram, create_session_folder, save_spectrogram
 
-    data, sr = load_wav(path)  # get samples and sample rate
-
-    fig, ax = plot_spectrogram(data, rate=sr)
+    if cache is not None:
+        power, freqs, times, sr = cache.spectrogram(
+            path, nfft=nfft, hop=hop, start=start, stop=stop, unit=unit)
+        fig, ax = _plot_power(power, freqs, times, pad=hop / sr / 2,
+                              offset=_range_offset(start, unit, sr))
+    else:
+        # get samples and sample rate
+        data, sr = load_wav(path, start=start, stop=stop, unit=unit)
+        fig, ax = plot_spectrogram(
+            data, rate=sr, nfft=nfft, hop=hop, offset=_range_offset(start, unit, sr))
 
     if session:
         folder = create_session_folder()
-        outfile = save_spectrogram(fig, folder)
+        if cache is not None:
+            outfile = cache.figure(path, _spectrogram_filename(folder), fig, nfft=nfft,
+                                   hop=hop, start=start, stop=stop, unit=unit)
+            _close_figure(fig)
+            _FOLDER_SIZES.file_written(outfile)
+        else:
+            outfile = save_spectrogram(fig, folder)
         print(f"Saved spectrogram to: {outfile}")
         return fig, ax, outfile
     else:
         return fig, ax
 
 
+def _range_offset(start, unit: str, samplerate: int) -> float:
+    """Seconds between the start of a file and a partial-read ``start``."""
+    if start is None:
+        return 0.0
+    return start if unit == "seconds" else start / samplerate
+
+
 def get_default_directory() -> str:
     """Return the default directory based on the operating system."""
     system = platform.system().lower()
@@ -97,12 +331,26 @@ def _get_session_numbers(directory: str) -> list[int]:
 
 
 def create_session_folder(directory=None) -> str:
-    """Create a new session folder inside the provided directory."""
+    """
+    Create a new session folder inside the provided directory.
+
+    Numbers come from the directory's :class:`SessionManifest`; if the
+    manifest cannot be used (e.g. read-only index) the directory is scanned.
+    """
+    from .manifest import SessionManifest
+
     if directory is None:
         directory = get_default_directory()
 
     os.makedirs(directory, exist_ok=True)
 
+    try:
+        session_folder = SessionManifest(directory).allocate()
+        print(f"Created new session: {session_folder}")
+        return session_folder
+    except (OSError, sqlite3.Error):
+        pass
+
     next_number = max(_get_session_numbers(directory), default=0) + 1
     while True:
         session_folder = os.path.join(directory, f"session_{next_number}")
@@ -116,12 +364,19 @@ def create_session_folder(directory=None) -> str:
 
 def get_latest_session_folder(directory=None) -> str | None:
     """Find the session folder with the highest number and return its path."""
+    from .manifest import SessionManifest
+
     if directory is None:
         directory = get_default_directory()
 
     if not os.path.exists(directory):
         return None
 
+    try:
+        return SessionManifest(directory).latest()
+    except (OSError, sqlite3.Error):
+        pass
+
     session_numbers = _get_session_numbers(directory)
     if not session_numbers:
         return None
@@ -130,39 +385,496 @@ def get_latest_session_folder(directory=None) -> str | None:
     return os.path.join(directory, f"session_{latest_session}")
 
 
-def plot_spectrogram(data, rate=44100):
+def _get_window(window, nfft: int) -> np.ndarray:
+    """Resolve a window name or array into an ``nfft``-length float array."""
+    if window is None:
+        window = "boxcar"
+
+    if isinstance(window, str):
+        name = window.lower()
+        if name not in _WINDOWS:
+            raise ValueError(
+                f"Unknown window '{window}'. Expected one of: {', '.join(sorted(_WINDOWS))}")
+        return _WINDOWS[name](nfft)
+
+    # Copy, so freezing the plan's window never touches the caller's array.
+    win = np.array(window, dtype=np.float64)
+    if win.shape != (nfft,):
+        raise ValueError(
+            f"Window length {win.shape} does not match nfft={nfft}")
+    return win
+
+
+class SpectrogramPlan(NamedTuple):
+    """Precomputed STFT setup shared by every signal with the same parameters."""
+    window: np.ndarray
+    scale: float
+    n_frames: int
+    padded_length: int
+    freqs: np.ndarray
+    times: np.ndarray
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class SpectrogramPlanCache:
+    """
+    Thread-safe LRU cache of :class:`SpectrogramPlan` objects keyed by
+    ``(nfft, hop, window, rate, length)``.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self._plans: "OrderedDict[tuple, SpectrogramPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, nfft: int, hop: int, window, rate, length: int) -> SpectrogramPlan:
+        """Return the plan for these parameters, building it on a miss."""
+        key = (nfft, hop, _window_key(window), rate, length)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        plan = _build_plan(nfft, hop, window, rate, length)
+
+        with self._lock:
+            if self.maxsize > 0:
+                self._plans[key] = plan
+                self._plans.move_to_end(key)
+                while len(self._plans) > self.maxsize:
+                    self._plans.popitem(last=False)
+        return plan
+
+    def resize(self, maxsize: int):
+        """Change the maximum number of plans, evicting the oldest if needed."""
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._plans) > maxsize:
+                self._plans.popitem(last=False)
+
+    def clear(self):
+        """Drop all plans and reset the hit/miss counters."""
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._plans))
+
+
+def _window_key(window):
+    """Build a hashable cache key for a window name or array."""
+    if window is None or isinstance(window, str):
+        return window
+    win = np.asarray(window, dtype=np.float64)
+    return ("array", win.shape, win.tobytes())
+
+
+def _build_plan(nfft: int, hop: int, window, rate, length: int) -> SpectrogramPlan:
+    win = _get_window(window, nfft)
+    win.setflags(write=False)
+
+    padded_length = max(length, nfft)
+    n_frames = (padded_length - nfft) // hop + 1
+
+    freqs = np.fft.rfftfreq(nfft, d=1.0 / rate)
+    times = (np.arange(n_frames) * hop + nfft / 2) / rate
+    freqs.setflags(write=False)
+    times.setflags(write=False)
+
+    return SpectrogramPlan(
+        window=win,
+        scale=float(rate * np.sum(win ** 2)),
+        n_frames=n_frames,
+        padded_length=padded_length,
+        freqs=freqs,
+        times=times,
+    )
+
+
+_PLAN_CACHE = SpectrogramPlanCache()
+
+
+def spectrogram_cache_info() -> CacheInfo:
+    """Return hit/miss counters and size of the spectrogram plan cache."""
+    return _PLAN_CACHE.info()
+
+
+def set_spectrogram_cache_size(maxsize: int):
+    """Set how many spectrogram plans are kept. ``0`` disables caching."""
+    _PLAN_CACHE.resize(maxsize)
+
+
+def clear_spectrogram_cache():
+    """Empty the spectrogram plan cache and reset its counters."""
+    _PLAN_CACHE.clear()
+
+
+def _frame_signal(data: np.ndarray, nfft: int, hop: int) -> np.ndarray:
+    """
+    Return a strided ``(..., n_frames, nfft)`` view over the last axis of
+    ``data`` without copying.
+    """
+    if data.shape[-1] < nfft:
+        padding = [(0, 0)] * (data.ndim - 1) + [(0, nfft - data.shape[-1])]
+        data = np.pad(data, padding)
+    return np.lib.stride_tricks.sliding_window_view(data, nfft, axis=-1)[..., ::hop, :]
+
+
+def compute_spectrogram(data, rate=44100, nfft=256, hop=128, window="hann"):
+    """
+    Compute a one-sided power spectral density spectrogram.
+
+    Frames are taken as a strided view over the signal and transformed with a
+    single batched ``numpy.fft.rfft`` call. Scaling matches matplotlib's
+    ``specgram`` defaults, so results are interchangeable with ``ax.specgram``.
+    Windows and axes come from the shared plan cache, see
+    :func:`spectrogram_cache_info`; the returned axes are read-only.
+
+    Returns:
+        (power, freqs, times) where power has shape (len(freqs), len(times))
+    """
+    if nfft <= 0 or hop <= 0:
+        raise ValueError("nfft and hop must be positive integers")
+
+    samples = np.asarray(data)
+    if samples.ndim != 1:
+        raise ValueError("compute_spectrogram expects a 1D signal")
+    if not np.issubdtype(samples.dtype, np.floating):
+        samples = samples.astype(np.float64)
+
+    with metrics.timed("stft"):
+        plan = _PLAN_CACHE.get(nfft, hop, window, rate, len(samples))
+        frames = _frame_signal(samples, nfft, hop)
+        power = _frames_to_power(frames, plan)
+
+    return power, plan.freqs, plan.times
+
+
+_BATCH_FRAME_BYTES = 4 << 20
+
+
+def compute_spectrogram_batch(clips, rate=44100, nfft=256, hop=128, window="hann",
+                              batch_size: Optional[int] = None):
+    """
+    Compute the spectrograms of many clips with one batched FFT.
+
+    ``clips`` is an ``(n_clips, n_samples)`` array, or a sequence of 1D
+    clips which are zero-padded at the end to the longest one. All clips
+    share one plan lookup, and each group of ``batch_size`` clips is
+    transformed by a single ``numpy.fft.rfft`` call. By default groups hold
+    about 4 MiB of frames, which keeps the intermediate arrays in cache and
+    is faster than one call over a very large batch.
+    Each ``power[i]`` equals ``compute_spectrogram(clips[i], ...)[0]``;
+    trailing columns of padded clips hold the (zero) power of the padding.
+
+    Returns:
+        (power, freqs, times) where power has shape (n_clips, len(freqs), len(times))
+    """
+    if nfft <= 0 or hop <= 0:
+        raise ValueError("nfft and hop must be positive integers")
+    if batch_size is not None and batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer")
+
+    if isinstance(clips, np.ndarray):
+        if clips.ndim != 2:
+            raise ValueError("compute_spectrogram_batch expects an (n_clips, n_samples) array")
+        lengths = None
+        n_clips, n_samples = clips.shape
+        dtype = clips.dtype
+    else:
+        clips = [np.asarray(clip) for clip in clips]
+        if any(clip.ndim != 1 for clip in clips):
+            raise ValueError("compute_spectrogram_batch expects 1D clips")
+        lengths = [len(clip) for clip in clips]
+        n_clips, n_samples = len(clips), max(lengths, default=0)
+        dtype = np.result_type(*clips) if clips else np.float64
+    if not np.issubdtype(dtype, np.floating):
+        dtype = np.float64
+
+    plan = _PLAN_CACHE.get(nfft, hop, window, rate, n_samples)
+    if batch_size is None:
+        clip_bytes = len(plan.times) * nfft * np.dtype(dtype).itemsize
+        batch_size = max(1, _BATCH_FRAME_BYTES // clip_bytes)
+    group = batch_size
+    power = None
+
+    with metrics.timed("stft", clips=n_clips):
+        for start in range(0, n_clips, group):
+            stop = min(start + group, n_clips)
+            if lengths is None:
+                block = clips[start:stop].astype(dtype, copy=False)
+            else:
+                block = np.zeros((stop - start, n_samples), dtype=dtype)
+                for row, clip in enumerate(clips[start:stop]):
+                    block[row, :len(clip)] = clip
+
+            block_power = _frames_to_power(_frame_signal(block, nfft, hop), plan)
+            if power is None:
+                if stop == n_clips:
+                    power = block_power
+                    break
+                power = np.empty((n_clips,) + block_power.shape[1:], dtype=block_power.dtype)
+            power[start:stop] = block_power
+
+    if power is None:
+        power = np.empty((0, len(plan.freqs), len(plan.times)))
+    return power, plan.freqs, plan.times
+
+
+def compute_multichannel_spectrogram(data, rate=44100, nfft=256, hop=128, window="hann"):
+    """
+    Compute one spectrogram per channel of (frames, channels) audio, such as
+    ``load_wav(path, mono=False)``.
+
+    The channels are framed as strided views of the interleaved samples, so
+    no per-channel copies are made, and transformed together with
+    :func:`compute_spectrogram_batch`: short recordings take one FFT call for
+    all channels, long ones are grouped to keep intermediates in cache.
+    ``power[c]`` equals ``compute_spectrogram(data[:, c], ...)[0]``.
+
+    Returns:
+        (power, freqs, times) where power has shape (channels, len(freqs), len(times))
+    """
+    samples = np.asarray(data)
+    if samples.ndim != 2:
+        raise ValueError("compute_multichannel_spectrogram expects (frames, channels) audio")
+    return compute_spectrogram_batch(samples.T, rate=rate, nfft=nfft, hop=hop,
+                                     window=window)
+
+
+def _frames_to_power(frames: np.ndarray, plan: SpectrogramPlan) -> np.ndarray:
+    """
+    Window and transform ``(..., n_frames, nfft)`` frames into
+    ``(..., freq, n_frames)`` PSD.
+    """
+    nfft = frames.shape[-1]
+    spectrum = np.fft.rfft(frames * plan.window, n=nfft, axis=-1)
+    power = np.swapaxes(spectrum.real ** 2 + spectrum.imag ** 2, -1, -2)
+
+    # One-sided scaling: double everything except DC (and Nyquist for even nfft).
+    last = -1 if nfft % 2 == 0 else None
+    power[..., 1:last, :] *= 2.0
+    power /= plan.scale
+    return power
+
+
+_POWER_FLOOR = np.finfo(np.float64).tiny
+_DB_FLOOR = 10 * np.log10(_POWER_FLOOR)
+
+
+def _power_to_db(power: np.ndarray) -> np.ndarray:
+    """Convert power to decibels, flooring zeros to avoid ``log10(0)``."""
+    return 10 * np.log10(np.maximum(power, _POWER_FLOOR))
+
+
+def _db_limits(db: np.ndarray) -> Tuple[float, float]:
+    """
+    Autoscale ``(vmin, vmax)`` for a dB array, ignoring bins floored by
+    :func:`_power_to_db`. Digital silence would otherwise pull ``vmin`` down
+    to about -3076 dB; matplotlib's ``specgram`` masks the ``-inf`` instead.
+    """
+    valid = db > _DB_FLOOR
+    if not valid.any():
+        return _DB_FLOOR, _DB_FLOOR
+    return (float(np.min(db, where=valid, initial=np.inf)),
+            float(np.max(db, where=valid, initial=-np.inf)))
+
+
+def _stream_block_layout(nfft: int, hop: int, columns_per_block: int) -> Tuple[int, int]:
+    """Return ``(blocksize, overlap)`` so each full block yields exactly
+    ``columns_per_block`` STFT frames and consecutive blocks tile seamlessly."""
+    if columns_per_block <= 0:
+        raise ValueError("columns_per_block must be a positive integer")
+    blocksize = (columns_per_block - 1) * hop + nfft
+    overlap = nfft - hop if nfft > hop else 0
+    return blocksize, overlap
+
+
+def iter_wav_spectrogram(path: str, nfft=256, hop=128, window="hann",
+                         columns_per_block=1024):
+    """
+    Stream the spectrogram of a WAV file block by block.
+
+    Audio is read with ``soundfile.blocks`` using ``nfft - hop`` frames of
+    overlap, so the concatenated output equals ``compute_spectrogram`` on the
+    whole (mono-mixed) file. Peak memory depends on ``columns_per_block``,
+    never on the file length.
+
+    Yields:
+        (power, freqs, times) for each block, with times in absolute seconds
+    """
+    if nfft <= 0 or hop <= 0:
+        raise ValueError("nfft and hop must be positive integers")
+    if hop > nfft:
+        raise ValueError("hop must not exceed nfft when streaming")
+
+    blocksize, overlap = _stream_block_layout(nfft, hop, columns_per_block)
+    rate = sf.info(path).samplerate
+    column = 0
+
+    for block in sf.blocks(path, blocksize=blocksize, overlap=overlap,
+                           dtype="float32", always_2d=True):
+        if column > 0 and len(block) < nfft:
+            break
+
+        mono = block.mean(axis=1) if block.shape[1] > 1 else block[:, 0]
+        power, freqs, times = compute_spectrogram(
+            mono, rate=rate, nfft=nfft, hop=hop, window=window)
+
+        yield power, freqs, times + column * hop / rate
+        column += power.shape[1]
+
+    if column == 0:
+        # An empty file yields no blocks; emit the zero-padded frame that
+        # compute_spectrogram produces for an empty signal.
+        yield compute_spectrogram(np.zeros(0, dtype=np.float32), rate=rate, nfft=nfft,
+                                  hop=hop, window=window)
+
+
+def compute_wav_spectrogram(path: str, out=None, nfft=256, hop=128, window="hann",
+                            columns_per_block=1024, dtype="float32"):
+    """
+    Compute the spectrogram of a WAV file of any length with bounded memory.
+
+    Columns produced by :func:`iter_wav_spectrogram` are written into ``out``,
+    which may be a preallocated ``(nfft // 2 + 1, n_columns)`` array, a path
+    for a new memory-mapped ``.npy`` file, or ``None`` to allocate in memory.
+
+    Returns:
+        (power, freqs, times)
+    """
+    info = sf.info(path)
+    n_columns = (max(info.frames, nfft) - nfft) // hop + 1
+    shape = (nfft // 2 + 1, n_columns)
+
+    if out is None:
+        power = np.empty(shape, dtype=dtype)
+    elif isinstance(out, (str, os.PathLike)):
+        power = np.lib.format.open_memmap(
+            out, mode="w+", dtype=dtype, shape=shape)
+    else:
+        power = out
+        if power.shape != shape:
+            raise ValueError(
+                f"Output array has shape {power.shape}, expected {shape}")
+
+    freqs = np.fft.rfftfreq(nfft, d=1.0 / info.samplerate)
+    column = 0
+    for block, _, _ in iter_wav_spectrogram(
+            path, nfft=nfft, hop=hop, window=window,
+            columns_per_block=columns_per_block):
+        power[:, column:column + block.shape[1]] = block
+        column += block.shape[1]
+
+    if isinstance(power, np.memmap):
+        power.flush()
+
+    times = (np.arange(n_columns) * hop + nfft / 2) / info.samplerate
+    return power, freqs, times
+
+
+def plot_spectrogram(data, rate=44100, nfft=256, hop=128, window="hann", offset=0.0):
     """
     Creates a spectrogram using the OO interface. 
     No GUI backends are initialized.
+    ``offset`` shifts the time axis, in seconds, e.g. for partial reads.
     """
+    power, freqs, times = compute_spectrogram(
+        data, rate=rate, nfft=nfft, hop=hop, window=window)
+    return _plot_power(power, freqs, times, pad=hop / rate / 2, offset=offset)
+
+
+def _plot_power(power, freqs, times, pad=0.0, offset=0.0):
+    """Draw a precomputed power spectrogram and return ``(fig, ax)``."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+    from matplotlib.figure import Figure
+
+    with metrics.timed("render"):
+        fig = Figure(figsize=(10, 6), dpi=100)
+        canvas = FigureCanvas(fig)
+        ax = fig.add_subplot(111)
 
-    fig = Figure(figsize=(10, 6), dpi=100)
-    canvas = FigureCanvas(fig)
-    ax = fig.add_subplot(111)
-    Pxx, freqs, bins, im = ax.specgram(data, Fs=rate, cmap='viridis')
+        extent = (offset + times[0] - pad, offset + times[-1] + pad,
+                  freqs[0], freqs[-1])
+        db = _power_to_db(power)
+        vmin, vmax = _db_limits(db)
+        ax.imshow(db, cmap='viridis', origin='lower', aspect='auto', extent=extent,
+                  interpolation='nearest', vmin=vmin, vmax=vmax)
 
-    ax.set_xlabel('Time (s)')
-    ax.set_ylabel('Frequency (Hz)')
-    ax.set_title('Spectrogram')
+        ax.set_xlabel('Time (s)')
+        ax.set_ylabel('Frequency (Hz)')
+        ax.set_title('Spectrogram')
 
     return fig, ax
 
 
-def save_spectrogram(fig, session_folder) -> str:
-    """Save the generated spectrogram plot to the session folder."""
+def _spectrogram_filename(session_folder: str) -> str:
     timestamp = time.ctime().replace(" ", "_").replace(":", "-")
-    filename = os.path.join(session_folder, f"spectrogram_{timestamp}.png")
-    fig.savefig(filename)
-    plt.close(fig)
+    return os.path.join(session_folder, f"spectrogram_{timestamp}.png")
+
+
+def save_spectrogram(fig, session_folder, writer=None, return_future: bool = False):
+    """
+    Save the generated spectrogram plot to the session folder.
+
+    With an :class:`OutputWriter` the save happens in the background and the
+    filename is returned immediately. Pass ``return_future=True`` to get
+    ``(filename, future)`` and check the write yourself; otherwise a failed
+    background write is reported with a ``RuntimeWarning``.
+    """
+    filename = _spectrogram_filename(session_folder)
+    if writer is not None:
+        future = writer.submit_figure(fig, filename)
+        _account_when_done(future, filename, warn=not return_future)
+        return (filename, future) if return_future else filename
+    with metrics.timed("encode", format="png"):
+        fig.savefig(filename)
+    _close_figure(fig)
+    _FOLDER_SIZES.file_written(filename)
     return filename
 
 
+def _account_when_done(future, path: str, warn: bool = True):
+    """
+    Update cached folder sizes once a background write has succeeded, and
+    with ``warn`` report a failed one, whose future nobody else holds.
+    """
+    def done(f):
+        if f.cancelled():
+            return
+        error = f.exception()
+        if error is None:
+            _FOLDER_SIZES.file_written(path)
+        elif warn:
+            warnings.warn(f"Background write of {path} failed: {error!r}", RuntimeWarning)
+    future.add_done_callback(done)
+
+
 def record_audio(duration=3, rate=44100, channels=1):
     """Record audio data and return it as a flattened array."""
+    import sounddevice as sd
+
     print("Starting recording...")
-    audio_data = sd.rec(int(rate * duration),
-                        samplerate=rate, channels=channels)
-    sd.wait()
+    with metrics.timed("record"):
+        audio_data = sd.rec(int(rate * duration),
+                            samplerate=rate, channels=channels)
+        sd.wait()
     print("Recording finished.")
     return audio_data.flatten()
 
@@ -177,28 +889,161 @@ def delete_latest_session_folder(directory=None):
         print("No session folders found to delete.")
         return
 
+    from .manifest import SessionManifest
+
     try:
-        shutil.rmtree(latest_session_folder)
+        try:
+            SessionManifest(directory).delete(latest_session_folder)
+        except sqlite3.Error:
+            shutil.rmtree(latest_session_folder)
         print(f"Deleted the latest session folder: {latest_session_folder}")
     except Exception as exc:
         print(f"Error deleting the folder: {exc}")
 
 
-def get_folder_size(directory=None):
-    """Calculate the total size of a directory."""
+def _scan_size(directory: str) -> Tuple[int, Dict[str, int], List[str]]:
+    """
+    Size the files directly inside ``directory`` from their ``DirEntry`` stats.
+
+    Returns:
+        (total_bytes, {filename: size}, [subdirectory paths])
+    """
+    total = 0
+    files: Dict[str, int] = {}
+    subdirs: List[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    size = entry.stat().st_size
+                    files[entry.name] = size
+                    total += size
+            except FileNotFoundError:
+                continue
+    return total, files, subdirs
+
+
+def _tree_size(directory: str) -> int:
+    """Recursively size a directory tree without following directory symlinks."""
+    total = 0
+    stack = [directory]
+    while stack:
+        size, _, subdirs = _scan_size(stack.pop())
+        total += size
+        stack.extend(subdirs)
+    return total
+
+
+class _FolderSizeCache:
+    """
+    Sizes of flat folders (no subdirectories), kept current by the
+    library's own writes.
+
+    An entry is trusted while the folder's mtime is unchanged, i.e. no file
+    or subdirectory was added or removed behind the library's back, so a
+    hit costs one stat. Files modified in place by other programs do not
+    change the folder's mtime and are not detected; :meth:`invalidate`
+    forgets an entry.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+
+    def get(self, folder: str) -> Optional[int]:
+        folder = os.path.abspath(folder)
+        with self._lock:
+            entry = self._entries.get(folder)
+        if entry is None:
+            return None
+        try:
+            if os.stat(folder).st_mtime_ns != entry["mtime_ns"]:
+                return None
+        except FileNotFoundError:
+            return None
+        return entry["total"]
+
+    def put(self, folder: str, mtime_ns: int, files: Dict[str, int], total: int):
+        with self._lock:
+            self._entries[os.path.abspath(folder)] = {
+                "mtime_ns": mtime_ns, "files": files, "total": total}
+
+    def file_written(self, path: str):
+        """Account for a file the library has just created or overwritten."""
+        folder, name = os.path.split(os.path.abspath(path))
+        with self._lock:
+            entry = self._entries.get(folder)
+            if entry is None:
+                return
+            try:
+                size = os.stat(path).st_size
+                mtime_ns = os.stat(folder).st_mtime_ns
+            except FileNotFoundError:
+                del self._entries[folder]
+                return
+            entry["total"] += size - entry["files"].get(name, 0)
+            entry["files"][name] = size
+            entry["mtime_ns"] = mtime_ns
+
+    def invalidate(self, folder: str):
+        with self._lock:
+            self._entries.pop(os.path.abspath(folder), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_FOLDER_SIZES = _FolderSizeCache()
+
+
+def get_folder_size(directory=None, workers: Optional[int] = None, cached: bool = False):
+    """
+    Calculate the total size of a directory.
+
+    Uses ``os.scandir`` and the stats cached on each ``DirEntry``. With
+    ``workers`` > 1 subdirectories are sized in parallel threads. With
+    ``cached=True`` the size of a folder without subdirectories (such as a
+    session folder) is remembered and kept up to date as the library writes
+    into it, so a repeat query costs a single stat. Files added or removed
+    by other programs trigger a rescan; files they modify in place do not,
+    so call :func:`invalidate_folder_size` after such changes.
+    """
     if directory is None:
         directory = get_default_directory()
 
-    total_size = 0
-    for dirpath, _, filenames in os.walk(directory):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            total_size += os.path.getsize(file_path)
+    if cached:
+        size = _FOLDER_SIZES.get(directory)
+        if size is not None:
+            return size
+
+    mtime_ns = os.stat(directory).st_mtime_ns
+    total_size, files, subdirs = _scan_size(directory)
+
+    if workers is not None and workers > 1 and len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            total_size += sum(executor.map(_tree_size, subdirs))
+    else:
+        total_size += sum(_tree_size(subdir) for subdir in subdirs)
+
+    if cached and not subdirs:
+        _FOLDER_SIZES.put(directory, mtime_ns, files, total_size)
     return total_size
 
 
+def invalidate_folder_size(directory=None):
+    """Forget the cached size of ``directory`` so the next query rescans it."""
+    if directory is None:
+        directory = get_default_directory()
+    _FOLDER_SIZES.invalidate(directory)
+
+
 def print_folder_size(directory=None):
     """Print the total size of the latest session folder."""
+    from .manifest import SessionManifest
+
     if directory is None:
         directory = get_default_directory()
 
@@ -207,13 +1052,19 @@ def print_folder_size(directory=None):
         print("No session folder found.")
         return
 
-    total_size = get_folder_size(latest_session_folder)
+    total_size = get_folder_size(latest_session_folder, cached=True)
+    if os.path.isdir(latest_session_folder):
+        try:
+            SessionManifest(directory).set_size(latest_session_folder, total_size)
+        except (OSError, sqlite3.Error):
+            pass
+
     print(
         f"Total size of folder {latest_session_folder}: {total_size / (1024 * 1024):.2f} MB"
     )
 
 
-def plot_all_wavs(directory: str, session: bool = True):
+def plot_all_wavs(directory: str, session: bool = True, cache=None, nfft=256, hop=128):
     """
     Load and plot all WAV files in a directory.
     """
@@ -222,15 +1073,18 @@ def plot_all_wavs(directory: str, session: bool = True):
     for file in os.listdir(directory):
         if file.lower().endswith(".wav"):
             path = os.path.join(directory, file)
-            result = load_and_plot_wav(path, session=session)
+            result = load_and_plot_wav(path, session=session, cache=cache, nfft=nfft, hop=hop)
             results.append((file, result))
 
     return results
 
 
-def record_and_save_wav(duration=3, rate=44100, channels=1, directory=None) -> str:
+def record_and_save_wav(duration=3, rate=44100, channels=1, directory=None,
+                        writer=None, return_future: bool = False):
     """
     Record audio and save as WAV file inside a new session folder.
+    With an :class:`OutputWriter` the file is written in the background;
+    ``return_future`` works as in :func:`save_spectrogram`.
     """
     if directory is None:
         directory = get_default_directory()
@@ -242,7 +1096,13 @@ def record_and_save_wav(duration=3, rate=44100, channels=1, directory=None) -> s
     timestamp = time.ctime().replace(" ", "_").replace(":", "-")
     filename = os.path.join(session_folder, f"recording_{timestamp}.wav")
 
-    sf.write(filename, audio_data, rate)
+    if writer is not None:
+        future = writer.submit_wav(filename, audio_data, rate)
+        _account_when_done(future, filename, warn=not return_future)
+        print(f"Queued recording for: {filename}")
+        return (filename, future) if return_future else filename
+
+    save_wav(filename, audio_data, rate)
 
     print(f"Saved recording to: {filename}")
     return filename
@@ -252,6 +1112,8 @@ def play_wav(path: str):
     """
     Play a WAV file.
     """
+    import sounddevice as sd
+
     data, sr = load_wav(path)
     sd.play(data, sr)
     sd.wait()
@@ -261,53 +1123,246 @@ def save_wav(path: str, audio_data: np.ndarray, samplerate: int):
     """
     Save numpy audio array to WAV file.
     """
-    sf.write(path, audio_data, samplerate)
+    with metrics.timed("write", format="wav"):
+        sf.write(path, audio_data, samplerate)
+    _FOLDER_SIZES.file_written(path)
+
+
+def _peak(audio_data: np.ndarray) -> float:
+    """Largest absolute sample value, without allocating ``abs(audio_data)``."""
+    return max(float(np.max(audio_data)), -float(np.min(audio_data)))
 
 
-def normalize_audio(audio_data: np.ndarray) -> np.ndarray:
+def normalize_audio(audio_data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Normalize audio to range [-1, 1].
+
+    ``out`` receives the result instead of a new array; pass
+    ``out=audio_data`` to normalize in place.
     """
-    max_val = np.max(np.abs(audio_data))
+    max_val = _peak(audio_data)
     if max_val == 0:
-        return audio_data
-    return audio_data / max_val
+        if out is None or out is audio_data:
+            return audio_data
+        out[...] = audio_data
+        return out
+    return np.divide(audio_data, max_val, out=out)
+
+
+def _loud_frames(block: np.ndarray, threshold: float) -> np.ndarray:
+    """Boolean mask of frames where any channel exceeds ``threshold``."""
+    loud = np.abs(block) > threshold
+    return loud.any(axis=1) if loud.ndim == 2 else loud
+
+
+def _loud_bounds(audio_data: np.ndarray, threshold: float) -> Optional[Tuple[int, int]]:
+    """
+    ``(start, end)`` of the frames between the first and last loud frame,
+    or None if nothing exceeds ``threshold``. Scans inward from both ends in
+    blocks, so only a block-sized mask is ever allocated.
+    """
+    frames = len(audio_data)
+    for block_start in range(0, frames, _MIX_BLOCK):
+        loud = _loud_frames(audio_data[block_start:block_start + _MIX_BLOCK], threshold)
+        if loud.any():
+            start = block_start + int(np.argmax(loud))
+            break
+    else:
+        return None
+
+    for block_end in range(frames, start, -_MIX_BLOCK):
+        block_start = max(start, block_end - _MIX_BLOCK)
+        loud = _loud_frames(audio_data[block_start:block_end], threshold)
+        if loud.any():
+            return start, block_end - int(np.argmax(loud[::-1]))
+    return start, start + 1
 
 
 def trim_silence(audio_data: np.ndarray, threshold=0.01) -> np.ndarray:
     """
     Remove leading and trailing silence.
+
+    Returns a view of ``audio_data``; nothing is copied. For
+    (frames, channels) audio a frame is silent when every channel is.
     """
-    mask = np.abs(audio_data) > threshold
-    if not np.any(mask):
+    bounds = _loud_bounds(audio_data, threshold)
+    if bounds is None:
         return audio_data
 
-    start = np.argmax(mask)
-    end = len(audio_data) - np.argmax(mask[::-1])
+    start, end = bounds
     return audio_data[start:end]
 
 
-def batch_process_wavs(directory: str):
+def _rewrite_wav(path: str, output_path: str, normalize: bool, trim: bool,
+                 threshold: float, blocksize: int, subtype: Optional[str]) -> str:
     """
-    Load, normalize, trim, plot, and save all WAV files in directory.
+    Two streaming passes: the first records each block's peak, the second
+    writes the scaled frames between the trim boundaries. Memory is one
+    block buffer plus one float per block.
     """
+    if blocksize <= 0:
+        raise ValueError("blocksize must be a positive integer")
+
+    info = sf.info(path)
+    buffer = np.empty((blocksize, info.channels), dtype=np.float32)
+    peaks = np.array([_peak(block) if len(block) else 0.0
+                      for block in sf.blocks(path, out=buffer)])
+
+    peak = float(peaks.max()) if len(peaks) else 0.0
+    scale = 1.0 / peak if normalize and peak > 0 else 1.0
+    start, stop = 0, info.frames
+
+    with sf.SoundFile(path) as source:
+        if trim:
+            # Silence is judged on the output, i.e. after normalization.
+            loud_blocks = np.flatnonzero(peaks * scale > threshold)
+            if len(loud_blocks):
+                first, last = int(loud_blocks[0]), int(loud_blocks[-1])
+                source.seek(first * blocksize)
+                block = source.read(out=buffer)
+                start = first * blocksize + _loud_bounds(block * scale, threshold)[0]
+                source.seek(last * blocksize)
+                block = source.read(out=buffer)
+                stop = last * blocksize + _loud_bounds(block * scale, threshold)[1]
+
+        with sf.SoundFile(output_path, "w", samplerate=info.samplerate,
+                          channels=info.channels, format=info.format,
+                          subtype=subtype or info.subtype) as target:
+            source.seek(start)
+            for offset in range(start, stop, blocksize):
+                block = source.read(out=buffer[:min(blocksize, stop - offset)])
+                if scale != 1.0:
+                    block *= scale
+                target.write(block)
+
+    _FOLDER_SIZES.file_written(output_path)
+    return output_path
+
+
+def normalize_wav(path: str, output_path: str, trim: bool = False, threshold=0.01,
+                  blocksize: int = 65536, subtype: Optional[str] = None) -> str:
+    """
+    Streaming :func:`normalize_audio` for sound files of any size.
 
-    session_folder = create_session_folder()
+    The peak across all channels is found in a first pass over
+    ``soundfile.blocks`` and the scaled audio is written block by block in
+    a second, so memory use does not depend on the file length. With
+    ``trim=True`` leading and trailing silence is dropped in the same pass,
+    as ``trim_silence(normalize_audio(audio), threshold)`` would. The output
+    keeps the input's channels, format and (unless ``subtype`` is given)
+    subtype.
 
-    for file in os.listdir(directory):
-        if not file.lower().endswith(".wav"):
-            continue
+    Returns:
+        output_path
+    """
+    return _rewrite_wav(path, output_path, normalize=True, trim=trim, threshold=threshold,
+                        blocksize=blocksize, subtype=subtype)
 
-        path = os.path.join(directory, file)
+
+def trim_silence_wav(path: str, output_path: str, threshold=0.01,
+                     blocksize: int = 65536, subtype: Optional[str] = None) -> str:
+    """
+    Streaming :func:`trim_silence` for sound files of any size; see
+    :func:`normalize_wav`.
+
+    Returns:
+        output_path
+    """
+    return _rewrite_wav(path, output_path, normalize=False, trim=True, threshold=threshold,
+                        blocksize=blocksize, subtype=subtype)
+
+
+class BatchResult(NamedTuple):
+    """Outcome of processing a single file in :func:`batch_process_wavs`."""
+    file: str
+    output_path: Optional[str]
+    error: Optional[str]
+
+
+def _process_wav_file(path: str, output_path: str, fast: bool = False) -> BatchResult:
+    """Render one WAV file to PNG. Runs in worker processes, so never raises."""
+    file = os.path.basename(path)
+    try:
         data, sr = load_wav(path)
-        fig, ax = plot_spectrogram(data, rate=sr)
-        output_path = os.path.join(
-            session_folder, f"{os.path.splitext(file)[0]}.png")
-        fig.savefig(output_path)
+        if fast:
+            from .render import render_spectrogram_image
+
+            power, _, _ = compute_spectrogram(data, rate=sr)
+            render_spectrogram_image(power, output_path)
+        else:
+            fig, ax = plot_spectrogram(data, rate=sr)
+            try:
+                with metrics.timed("encode", format="png"):
+                    fig.savefig(output_path)
+            finally:
+                _close_figure(fig)
+    except Exception as exc:
+        return BatchResult(file, None, f"{type(exc).__name__}: {exc}")
+    return BatchResult(file, output_path, None)
+
+
+def _process_wav_file_recorded(path: str, output_path: str, fast: bool = False):
+    """Pool variant of :func:`_process_wav_file` that also returns its metrics events."""
+    with metrics.recording() as events:
+        result = _process_wav_file(path, output_path, fast)
+    return result, events
 
-        fig.clear()
 
-        print(f"Processed {file} -> {output_path}")
+def batch_process_wavs(directory: str, workers: Optional[int] = None,
+                       fast: bool = False,
+                       output_directory: Optional[str] = None) -> List[BatchResult]:
+    """
+    Load, plot, and save spectrograms of all WAV files in directory.
+
+    With ``workers`` > 1 files are spread across a process pool; otherwise
+    they are processed serially in this process. Each ``<name>.wav`` is saved
+    as ``<name>.png`` in a new session folder inside ``output_directory``
+    (default: :func:`get_default_directory`). ``fast=True`` skips the
+    matplotlib Figure and writes undecorated images with
+    :func:`render_spectrogram_image`.
+
+    Returns:
+        list of BatchResult(file, output_path, error) in sorted filename order
+    """
+    session_folder = create_session_folder(output_directory)
+
+    files = _list_wav_files(directory)
+    paths = [os.path.join(directory, file) for file in files]
+    outputs = [os.path.join(session_folder, f"{os.path.splitext(file)[0]}.png")
+               for file in files]
+
+    modes = [fast] * len(files)
+
+    if workers is None or workers <= 1:
+        results = map(_process_wav_file, paths, outputs, modes)
+        return [_report_batch_result(result) for result in results]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, min(64, len(files) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if not metrics.enabled():
+            results = executor.map(_process_wav_file, paths, outputs, modes,
+                                   chunksize=chunksize)
+            return [_report_batch_result(result) for result in results]
+
+        reports = []
+        for result, events in executor.map(_process_wav_file_recorded, paths,
+                                           outputs, modes, chunksize=chunksize):
+            metrics.replay(events)
+            reports.append(_report_batch_result(result))
+        return reports
+
+
+def _report_batch_result(result: BatchResult) -> BatchResult:
+    if result.error is None:
+        _FOLDER_SIZES.file_written(result.output_path)
+        metrics.count("files_processed")
+        print(f"Processed {result.file} -> {result.output_path}")
+    else:
+        metrics.count("files_failed")
+        print(f"Failed {result.file}: {result.error}")
+    return result
 
 
 def get_wav_info(path: str) -> dict:
@@ -325,13 +1380,65 @@ def get_wav_info(path: str) -> dict:
         }
 
 
-def to_mono(audio_data: np.ndarray) -> np.ndarray:
-    if audio_data.ndim == 2:
+_MIX_BLOCK = 1 << 16
+
+
+def to_mono(audio_data: np.ndarray, channel: Optional[int] = None,
+            out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Mix (frames, channels) audio down to mono.
+
+    ``channel`` selects one channel instead, returned as a view without
+    copying. ``out`` receives the mix; pass ``audio_data[:, 0]`` to mix in
+    place, which only needs a small temporary per block of frames.
+    """
+    if audio_data.ndim != 2:
+        return audio_data
+    if channel is not None:
+        return audio_data[:, channel]
+    if out is None:
         return audio_data.mean(axis=1)
-    return audio_data
+
+    for start in range(0, len(audio_data), _MIX_BLOCK):
+        np.mean(audio_data[start:start + _MIX_BLOCK], axis=1,
+                out=out[start:start + _MIX_BLOCK])
+    return out
 
 
-def to_stereo(audio_data: np.ndarray) -> np.ndarray:
+def to_stereo(audio_data: np.ndarray, view: bool = False) -> np.ndarray:
+    """
+    Duplicate mono audio into two channels. With ``view=True`` a read-only
+    (frames, 2) view over the mono samples is returned instead of a copy.
+    """
     if audio_data.ndim == 1:
+        if view:
+            return np.broadcast_to(audio_data[:, None], (len(audio_data), 2))
         return np.column_stack([audio_data, audio_data])
     return audio_data
+
+
+def pcm_to_float(audio_data: np.ndarray, mono: bool = True) -> np.ndarray:
+    """
+    Scale native PCM samples to float32 in [-1, 1], optionally mixing to mono.
+
+    Intended for slices of the memmap returned by ``load_wav(path, mmap=True)``
+    so only the touched frames are ever converted.
+    """
+    audio_data = np.asarray(audio_data)
+    kind = audio_data.dtype.kind
+
+    if kind == "u":
+        bits = audio_data.dtype.itemsize * 8
+        out = audio_data.astype(np.float32)
+        out -= 2 ** (bits - 1)
+        out /= 2 ** (bits - 1)
+    elif kind == "i":
+        bits = audio_data.dtype.itemsize * 8
+        out = audio_data.astype(np.float32)
+        out /= 2 ** (bits - 1)
+    else:
+        out = audio_data.astype(np.float32, copy=False)
+
+    if mono and out.ndim == 2:
+        out = out[:, 0] if out.shape[1] == 1 else out.mean(axis=1)
+    return out
@@ -0,0 +1,135 @@
+import json
+import struct
+from typing import Optional, Tuple
+
+import numpy as np
+
+_MAGIC = b"PYSPEC01"
+_ALIGN = 64
+_CHUNK_COLUMNS = 4096
+
+_ENCODINGS = {
+    "float32": np.dtype("<f4"),
+    "float16": np.dtype("<f2"),
+    "uint8": np.dtype("u1"),
+}
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _to_db(power: np.ndarray) -> np.ndarray:
+    from .spectrogram import _power_to_db
+
+    return _power_to_db(np.asarray(power, dtype=np.float64))
+
+
+def _db_range(power: np.ndarray) -> Tuple[float, float]:
+    """dB range of the bins with nonzero power; silent bins clip to the minimum."""
+    from .spectrogram import _DB_FLOOR, _db_limits
+
+    lo, hi = np.inf, -np.inf
+    for start in range(0, power.shape[1], _CHUNK_COLUMNS):
+        chunk_lo, chunk_hi = _db_limits(_to_db(power[:, start:start + _CHUNK_COLUMNS]))
+        if chunk_hi > _DB_FLOOR:
+            lo = min(lo, chunk_lo)
+            hi = max(hi, chunk_hi)
+    return (lo, hi) if hi >= lo else (_DB_FLOOR, _DB_FLOOR)
+
+
+def save_spectrogram_data(path: str, power: np.ndarray, freqs: np.ndarray,
+                          times: np.ndarray, encoding: str = "float16",
+                          db_range: Optional[Tuple[float, float]] = None) -> str:
+    """
+    Save a power spectrogram with its axes in a compact binary format.
+
+    Power is stored in decibels, time-major, so a time range is one contiguous
+    block on disk. ``encoding`` is ``"float16"`` (2 bytes per bin),
+    ``"uint8"`` (1 byte per bin, dB linearly quantized between ``db_range``,
+    which defaults to the range of the bins with nonzero power) or ``"float32"``. The array is encoded
+    in column chunks, so memory-mapped inputs are never loaded whole.
+    """
+    if encoding not in _ENCODINGS:
+        raise ValueError(
+            f"Unknown encoding '{encoding}'. Expected one of: {', '.join(_ENCODINGS)}")
+    n_freqs, n_times = power.shape
+    if len(freqs) != n_freqs or len(times) != n_times:
+        raise ValueError("freqs and times must match the power array shape")
+
+    header = {"version": 1, "encoding": encoding, "shape": [n_freqs, n_times]}
+    if encoding == "uint8":
+        lo, hi = db_range if db_range is not None else _db_range(power)
+        header["db_min"] = lo
+        header["db_step"] = (hi - lo) / 255 if hi > lo else 1.0
+    header_bytes = json.dumps(header).encode("utf-8")
+
+    dtype = _ENCODINGS[encoding]
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\0" * (_align(f.tell()) - f.tell()))
+        f.write(np.asarray(freqs, dtype="<f8").tobytes())
+        f.write(np.asarray(times, dtype="<f8").tobytes())
+        f.write(b"\0" * (_align(f.tell()) - f.tell()))
+
+        for start in range(0, n_times, _CHUNK_COLUMNS):
+            db = _to_db(power[:, start:start + _CHUNK_COLUMNS]).T
+            if encoding == "uint8":
+                db -= header["db_min"]
+                db /= header["db_step"]
+                np.clip(np.round(db, out=db), 0, 255, out=db)
+            f.write(np.ascontiguousarray(db, dtype=dtype).tobytes())
+
+    return path
+
+
+def _open_spectrogram_data(path: str):
+    with open(path, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path} is not a spectrogram data file")
+        (header_len,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(header_len).decode("utf-8"))
+
+    n_freqs, n_times = header["shape"]
+    axes_offset = _align(len(_MAGIC) + 4 + header_len)
+    data_offset = _align(axes_offset + 8 * (n_freqs + n_times))
+
+    axes = np.memmap(path, dtype="<f8", mode="r", offset=axes_offset,
+                     shape=(n_freqs + n_times,))
+    data = np.memmap(path, dtype=_ENCODINGS[header["encoding"]], mode="r",
+                     offset=data_offset, shape=(n_times, n_freqs))
+    return header, axes[:n_freqs], axes[n_freqs:], data
+
+
+def load_spectrogram_data(path: str, start: Optional[float] = None,
+                          stop: Optional[float] = None,
+                          as_db: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load a file written by :func:`save_spectrogram_data`.
+
+    The file is memory-mapped and only columns whose time (in seconds) falls
+    in ``[start, stop)`` are read and decoded.
+
+    Returns:
+        (power, freqs, times) with power of shape (len(freqs), len(times)),
+        in decibels when ``as_db`` is true
+    """
+    header, freqs, times, data = _open_spectrogram_data(path)
+
+    first = 0 if start is None else int(np.searchsorted(times, start, side="left"))
+    last = len(times) if stop is None else int(np.searchsorted(times, stop, side="left"))
+    last = max(first, last)
+
+    db = np.array(data[first:last], dtype=np.float32).T
+    if header["encoding"] == "uint8":
+        db *= header["db_step"]
+        db += header["db_min"]
+
+    if as_db:
+        power = db
+    else:
+        power = np.power(10.0, db / 10.0, dtype=np.float32)
+
+    return power, np.array(freqs), np.array(times[first:last])
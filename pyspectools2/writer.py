@@ -0,0 +1,103 @@
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional
+
+import numpy as np
+
+from . import metrics
+
+
+class OutputWriter:
+    """
+    Background writer for PNG, array and WAV output.
+
+    Work runs on a small thread pool so the caller never waits on encoding or
+    disk. At most ``max_pending`` writes may be queued or running; beyond
+    that ``submit`` blocks (backpressure) until a slot frees up, or raises
+    ``queue.Full`` once ``timeout`` expires. Pending writes are flushed on
+    :meth:`shutdown` and when leaving a ``with`` block.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16,
+                 timeout: Optional[float] = None):
+        if workers <= 0 or max_pending <= 0:
+            raise ValueError("workers and max_pending must be positive integers")
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix="pyspectools2-write")
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        """Queue ``func(*args, **kwargs)`` and return its future."""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise queue.Full("OutputWriter queue is full")
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._finished)
+        return future
+
+    def _finished(self, future: Future):
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def submit_figure(self, fig, path: str) -> Future:
+        """Save and close a matplotlib figure as ``path``."""
+        return self.submit(_save_figure, fig, path)
+
+    def submit_image(self, power: np.ndarray, path: str, **render_kwargs) -> Future:
+        """Render a power array straight to PNG with ``render_spectrogram_image``."""
+        from .render import render_spectrogram_image
+
+        return self.submit(render_spectrogram_image, power, path, **render_kwargs)
+
+    def submit_array(self, path: str, array: np.ndarray) -> Future:
+        """Save an array with ``numpy.save``."""
+        return self.submit(np.save, path, array)
+
+    def submit_wav(self, path: str, audio_data: np.ndarray, samplerate: int) -> Future:
+        """Write audio as a WAV file."""
+        from .spectrogram import save_wav
+
+        return self.submit(save_wav, path, audio_data, samplerate)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, timeout: Optional[float] = None):
+        """Wait until every write submitted so far has finished."""
+        with self._lock:
+            futures = list(self._pending)
+        wait(futures, timeout=timeout)
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work; with ``wait`` also flush pending writes."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown(wait=True)
+
+
+def _save_figure(fig, path: str) -> str:
+    from .spectrogram import _close_figure
+
+    try:
+        with metrics.timed("encode", format="png"):
+            fig.savefig(path)
+    finally:
+        _close_figure(fig)
+    return path
@@ -0,0 +1,16 @@
+# pyspectools2 imports matplotlib and sounddevice lazily, so load them before
+# test modules install their fallback stubs with ``sys.modules.setdefault``.
+try:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.backends.backend_agg  # noqa: F401
+    import matplotlib.figure  # noqa: F401
+    import matplotlib.pyplot  # noqa: F401
+except ImportError:
+    pass
+
+try:
+    import sounddevice  # noqa: F401
+except (ImportError, OSError):
+    pass
@@ -0,0 +1,116 @@
+import asyncio
+import os
+import tempfile
+import threading
+from unittest import mock
+import numpy as np
+import soundfile as sf
+import pyspectools2 as pst
+
+
+class ThreadedFakeStream:
+    """Fake InputStream that delivers audio from a background thread."""
+
+    def __init__(self, samplerate, channels, dtype, callback, block=64):
+        self.channels = channels
+        self.callback = callback
+        self.block = block
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self.closed = False
+
+    def _run(self):
+        value = 0.0
+        while not self._stop.is_set():
+            data = np.full((self.block, self.channels), value, dtype=np.float32)
+            self.callback(data, self.block, None, None)
+            value += 1.0
+            self._stop.wait(0.001)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def close(self):
+        self.closed = True
+
+
+def test_record_audio_async_awaits_callback_capture():
+    streams = []
+
+    def factory(**kwargs):
+        streams.append(ThreadedFakeStream(**kwargs))
+        return streams[-1]
+
+    audio = asyncio.run(pst.record_audio_async(
+        duration=0.1, rate=1000, stream_factory=factory))
+
+    assert audio.shape == (100,)
+    assert np.array_equal(audio[:64], np.zeros(64))
+    assert np.array_equal(audio[64:], np.ones(36))
+    assert streams[0].closed
+
+
+def test_concurrent_recordings_share_one_event_loop():
+    async def main():
+        return await asyncio.gather(*(
+            pst.record_audio_async(duration=0.05, rate=2000,
+                                   stream_factory=ThreadedFakeStream)
+            for _ in range(4)))
+
+    results = asyncio.run(main())
+    assert [len(audio) for audio in results] == [100] * 4
+
+
+def test_record_and_save_wav_async_writes_file():
+    from pyspectools2 import spectrogram
+
+    with tempfile.TemporaryDirectory() as temp_dir, \
+            mock.patch.object(spectrogram._FOLDER_SIZES, "file_written") as written:
+        path = asyncio.run(pst.record_and_save_wav_async(
+            duration=0.05, rate=2000, directory=temp_dir,
+            stream_factory=ThreadedFakeStream))
+
+        info = sf.info(path)
+        assert info.frames == 100
+        assert os.path.basename(os.path.dirname(path)) == "session_1"
+        written.assert_called_once_with(path)
+
+
+@mock.patch("pyspectools2.spectrogram.create_session_folder")
+def test_batch_process_wavs_async(mock_create):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_dir = os.path.join(temp_dir, "out")
+        os.mkdir(out_dir)
+        mock_create.return_value = out_dir
+        for i in range(3):
+            sf.write(os.path.join(temp_dir, f"clip_{i}.wav"),
+                     np.random.uniform(-0.5, 0.5, 1024).astype(np.float32), 8000)
+
+        results = asyncio.run(pst.batch_process_wavs_async(
+            temp_dir, fast=True, concurrency=2))
+
+        assert [r.file for r in results] == [f"clip_{i}.wav" for i in range(3)]
+        assert all(r.error is None for r in results)
+        assert sorted(os.listdir(out_dir)) == [f"clip_{i}.png" for i in range(3)]
+
+
+def test_load_and_compute_async_use_given_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with tempfile.TemporaryDirectory() as temp_dir, \
+            ThreadPoolExecutor(max_workers=1) as executor:
+        path = os.path.join(temp_dir, "clip.wav")
+        sf.write(path, np.random.uniform(-0.5, 0.5, 2048), 8000)
+
+        async def main():
+            data, rate = await pst.load_wav_async(path, executor=executor)
+            return await pst.compute_spectrogram_async(
+                data, executor=executor, rate=rate)
+
+        power, freqs, times = asyncio.run(main())
+
+    assert power.shape == (len(freqs), len(times))
@@ -66,3 +66,24 @@ def test_to_stereo():
     # Stereo stays stereo
     stereo = np.array([[0.1, 0.3], [0.2, 0.4]])
     assert np.array_equal(to_stereo(stereo), stereo)
+
+
+def test_to_mono_channel_view_and_in_place_mix():
+    stereo = np.array([[0.1, 0.3], [0.2, 0.4], [0.5, 0.1]])
+
+    right = to_mono(stereo, channel=1)
+    assert np.shares_memory(right, stereo)
+    assert np.array_equal(right, [0.3, 0.4, 0.1])
+
+    mixed = to_mono(stereo, out=stereo[:, 0])
+    assert np.shares_memory(mixed, stereo)
+    assert np.allclose(mixed, [0.2, 0.3, 0.3])
+
+
+def test_to_stereo_view_shares_memory():
+    mono = np.array([0.1, 0.2])
+    stereo = to_stereo(mono, view=True)
+    assert stereo.shape == (2, 2)
+    assert np.shares_memory(stereo, mono)
+    assert not stereo.flags.writeable
+    assert np.array_equal(stereo, to_stereo(mono))
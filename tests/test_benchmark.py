@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+
+import pytest
+
+from pyspectools2.scripts.benchmark import compare_results, main, run_benchmarks
+
+
+def test_run_benchmarks_reports_each_stage_and_case():
+    results = run_benchmarks(durations=[0.2], rates=[8000], channels=[1, 2],
+                             stages=["load", "stft", "save"], repeats=2)
+
+    assert len(results) == 6
+    for result in results:
+        assert result["throughput"] > 0
+        assert result["latency"]["p50"] <= result["latency"]["p99"] <= result["latency"]["max"]
+        assert result["peak_memory_bytes"] > 0
+        assert result["audio_seconds"] == pytest.approx(0.2)
+
+
+def test_batch_stage_stays_out_of_the_home_directory(monkeypatch):
+    with tempfile.TemporaryDirectory() as home:
+        monkeypatch.setenv("HOME", home)
+        results = run_benchmarks(durations=[0.1], rates=[8000], channels=[1],
+                                 stages=["batch"], repeats=1)
+        assert os.listdir(home) == []
+    assert results[0]["audio_seconds"] == pytest.approx(0.8)
+
+
+def test_unknown_stage_raises():
+    with pytest.raises(ValueError):
+        run_benchmarks(stages=["nope"])
+
+
+def test_main_writes_json_and_flags_regressions():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = os.path.join(temp_dir, "run.json")
+        argv = ["--durations", "0.1", "--rates", "8000", "--channels", "1",
+                "--stages", "stft", "--repeats", "1", "--output", output]
+        assert main(argv) == 0
+
+        with open(output) as f:
+            report = json.load(f)
+        assert report["environment"]["numpy"]
+        assert report["results"][0]["stage"] == "stft"
+
+        report["results"][0]["throughput"] *= 1000
+        with open(output, "w") as f:
+            json.dump(report, f)
+        assert main(argv[:-2] + ["--compare", output]) == 1
+
+
+def test_compare_results_matches_cases():
+    case = {"stage": "load", "duration": 1.0, "rate": 8000, "channels": 1}
+    rows = compare_results([dict(case, throughput=100.0)],
+                           [dict(case, throughput=50.0),
+                            dict(case, rate=16000, throughput=10.0)])
+    assert len(rows) == 1
+    assert rows[0]["ratio"] == pytest.approx(0.5)
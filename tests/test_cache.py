@@ -0,0 +1,144 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+import numpy as np
+import pytest
+import soundfile as sf
+import pyspectools2 as pst
+
+
+def _write_clip(path, seed=0, frames=4096):
+    rng = np.random.default_rng(seed)
+    sf.write(path, rng.uniform(-0.5, 0.5, frames).astype(np.float32), 8000)
+
+
+def test_spectrogram_cache_hits_on_unchanged_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        wav = os.path.join(temp_dir, "clip.wav")
+        _write_clip(wav)
+
+        with pst.SpectrogramCache(os.path.join(temp_dir, "cache")) as cache:
+            first = cache.spectrogram(wav)
+            with mock.patch("pyspectools2.spectrogram.load_wav") as load_mock:
+                second = cache.spectrogram(wav)
+
+            load_mock.assert_not_called()
+            assert cache.hits == 1 and cache.misses == 1
+            assert np.array_equal(first[0], second[0])
+            assert second[3] == 8000
+
+
+def test_spectrogram_cache_is_keyed_by_content_and_parameters():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        wav = os.path.join(temp_dir, "clip.wav")
+        copy = os.path.join(temp_dir, "copy.wav")
+        _write_clip(wav)
+        _write_clip(copy)
+
+        with pst.SpectrogramCache(os.path.join(temp_dir, "cache")) as cache:
+            cache.spectrogram(wav)
+            cache.spectrogram(copy)
+            assert cache.hits == 1
+
+            cache.spectrogram(wav, nfft=512)
+            assert cache.misses == 2
+
+            _write_clip(wav, seed=1)
+            os.utime(wav, ns=(1, 1))
+            cache.spectrogram(wav)
+            assert cache.misses == 3
+
+
+def test_spectrogram_cache_persists_between_instances():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        wav = os.path.join(temp_dir, "clip.wav")
+        _write_clip(wav)
+        cache_dir = os.path.join(temp_dir, "cache")
+
+        with pst.SpectrogramCache(cache_dir) as cache:
+            cache.image(wav, os.path.join(temp_dir, "a.png"))
+        with pst.SpectrogramCache(cache_dir) as cache:
+            cache.image(wav, os.path.join(temp_dir, "b.png"))
+            assert cache.hits == 1
+
+        assert Path(temp_dir, "a.png").read_bytes() == Path(temp_dir, "b.png").read_bytes()
+
+
+def test_spectrogram_cache_evicts_least_recently_used():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        wavs = []
+        for i in range(3):
+            wavs.append(os.path.join(temp_dir, f"clip_{i}.wav"))
+            _write_clip(wavs[-1], seed=i)
+
+        with pst.SpectrogramCache(os.path.join(temp_dir, "cache")) as cache:
+            cache.spectrogram(wavs[0])
+            entry_size = cache.size
+            cache.max_bytes = int(entry_size * 2.5)
+
+            cache.spectrogram(wavs[1])
+            cache.spectrogram(wavs[0])
+            cache.spectrogram(wavs[2])
+
+            assert cache.size <= cache.max_bytes
+            cache.spectrogram(wavs[0])
+            assert cache.hits == 2
+            cache.spectrogram(wavs[1])
+            assert cache.misses == 4
+
+
+def test_load_and_plot_wav_uses_cache():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        wav = os.path.join(temp_dir, "clip.wav")
+        _write_clip(wav)
+
+        with pst.SpectrogramCache(os.path.join(temp_dir, "cache")) as cache:
+            pst.load_and_plot_wav(wav, session=False, cache=cache)
+            with mock.patch("pyspectools2.spectrogram.load_wav") as load_mock:
+                fig, ax = pst.load_and_plot_wav(wav, session=False, cache=cache)
+
+        load_mock.assert_not_called()
+        assert ax.get_xlabel() == "Time (s)"
+
+
+def test_load_and_plot_wav_copies_cached_png_into_session():
+    from matplotlib.figure import Figure
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        wav = os.path.join(temp_dir, "clip.wav")
+        _write_clip(wav)
+        sessions = os.path.join(temp_dir, "sessions")
+        os.makedirs(sessions)
+
+        with pst.SpectrogramCache(os.path.join(temp_dir, "cache")) as cache, \
+                mock.patch("pyspectools2.spectrogram.get_default_directory",
+                           return_value=sessions):
+            _, _, first = pst.load_and_plot_wav(wav, cache=cache, hop=64)
+            with mock.patch.object(Figure, "savefig") as savefig:
+                _, _, second = pst.load_and_plot_wav(wav, cache=cache, hop=64)
+
+            savefig.assert_not_called()
+            assert os.path.dirname(first) != os.path.dirname(second)
+            assert Path(first).read_bytes() == Path(second).read_bytes()
+            assert cache.spectrogram(wav, hop=64)[1].shape == (129,)
+            assert cache.hits == 3
+
+
+def test_spectrogram_cache_keys_long_windows_by_content():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        wav = os.path.join(temp_dir, "clip.wav")
+        _write_clip(wav, frames=8192)
+        first = np.hanning(2048)
+        second = first.copy()
+        second[1024] += 1e-3
+        assert repr(first) == repr(second)
+
+        with pst.SpectrogramCache(os.path.join(temp_dir, "cache")) as cache:
+            power_first, _, _, _ = cache.spectrogram(wav, nfft=2048, hop=1024, window=first)
+            power_second, _, _, _ = cache.spectrogram(wav, nfft=2048, hop=1024, window=second)
+
+            assert cache.misses == 2
+            assert not np.array_equal(power_first, power_second)
+            with pytest.raises(TypeError):
+                cache.key(wav, "power", window=object())
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pyspectools2.spectrogram as spectrogram
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_HEADLESS = """
+import sys
+sys.modules["sounddevice"] = None  # as if PortAudio were missing
+
+import numpy as np
+import pyspectools2 as pst
+
+power, _, _ = pst.compute_spectrogram(np.random.rand(4096))
+pst.normalize_audio(np.random.rand(100))
+assert "matplotlib" not in sys.modules, "matplotlib imported eagerly"
+
+try:
+    pst.record_audio(duration=0.1)
+except ImportError:
+    print("ok")
+"""
+
+
+def test_import_and_array_processing_without_matplotlib_or_sounddevice():
+    result = subprocess.run([sys.executable, "-c", _HEADLESS], cwd=_ROOT,
+                            capture_output=True, text=True,
+                            env=dict(os.environ, PYTHONPATH=_ROOT))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
+
+
+def test_lazy_module_attributes_resolve_on_access():
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+
+    assert spectrogram.plt is plt
+    assert spectrogram.Figure is Figure
+    with pytest.raises(AttributeError):
+        spectrogram.not_a_dependency
@@ -0,0 +1,91 @@
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+from unittest import mock
+import pyspectools2 as pst
+from pyspectools2 import spectrogram
+from pyspectools2.manifest import SessionManifest
+
+
+def test_manifest_allocates_without_rescanning_directory():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest = SessionManifest(temp_dir)
+        first = manifest.allocate()
+
+        with mock.patch("pyspectools2.manifest.os.scandir",
+                        side_effect=AssertionError("rescanned")):
+            second = manifest.allocate()
+            latest = manifest.latest()
+
+        assert os.path.basename(first) == "session_1"
+        assert os.path.basename(second) == "session_2"
+        assert latest == second
+
+
+def test_manifest_rebuilds_after_external_changes():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest = SessionManifest(temp_dir)
+        manifest.allocate()
+        Path(temp_dir, "session_7").mkdir()
+
+        assert manifest.latest() == os.path.join(temp_dir, "session_7")
+
+        os.rmdir(os.path.join(temp_dir, "session_7"))
+        assert manifest.latest() == os.path.join(temp_dir, "session_1")
+
+
+def test_manifest_tracks_creation_time_and_size():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest = SessionManifest(temp_dir)
+        folder = manifest.allocate()
+        manifest.set_size(folder, 1234)
+
+        (record,) = manifest.sessions()
+
+    assert record.number == 1
+    assert record.path == folder
+    assert record.created > 0
+    assert record.size == 1234
+
+
+def test_manifest_rebuild_keeps_recorded_size_and_creation_time():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest = SessionManifest(temp_dir)
+        folder = manifest.allocate()
+        manifest.set_size(folder, 1234)
+        (before,) = manifest.sessions()
+
+        Path(temp_dir, "notes.txt").write_text("unrelated")
+        Path(temp_dir, "session_3").mkdir()
+        first, added = manifest.sessions()
+
+    assert first == before
+    assert added.number == 3 and added.size is None
+
+
+def test_session_functions_use_manifest_and_delete_updates_it():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pst.create_session_folder(temp_dir)
+        s2 = pst.create_session_folder(temp_dir)
+        assert os.path.isdir(os.path.join(temp_dir, ".pyspectools2"))
+
+        pst.delete_latest_session_folder(temp_dir)
+
+        assert not os.path.exists(s2)
+        assert [r.number for r in SessionManifest(temp_dir).sessions()] == [1]
+        assert pst.create_session_folder(temp_dir) == s2
+
+
+def test_session_functions_fall_back_to_scan_when_manifest_fails():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Path(temp_dir, "session_3").mkdir()
+        with mock.patch.object(SessionManifest, "allocate",
+                               side_effect=sqlite3.OperationalError("locked")), \
+                mock.patch.object(SessionManifest, "latest",
+                                  side_effect=sqlite3.OperationalError("locked")):
+            created = spectrogram.create_session_folder(temp_dir)
+            latest = spectrogram.get_latest_session_folder(temp_dir)
+
+        assert created.endswith("session_4")
+        assert latest == created
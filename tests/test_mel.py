@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import pyspectools2 as pst
+
+
+def test_mel_spectrogram_matches_dense_projection():
+    data = np.random.randn(16000)
+    mel, centers, times = pst.compute_mel_spectrogram(data, rate=16000, n_mels=40)
+
+    power, _, exp_times = pst.compute_spectrogram(data, rate=16000, nfft=1024, hop=512)
+    dense = pst.mel_filterbank(16000, 1024, 40).dense()
+    assert mel.shape == (40, len(times))
+    assert np.allclose(mel, dense @ power)
+    assert np.array_equal(times, exp_times)
+    assert np.all(np.diff(centers) > 0)
+
+
+def test_mel_filterbank_is_memoized_and_read_only():
+    first = pst.mel_filterbank(22050, 512, 32, 0.0, None, "mel")
+    assert pst.mel_filterbank(22050, 512, 32, 0.0, None, "mel") is first
+    with pytest.raises(ValueError):
+        first.centers[0] = 1.0
+
+
+def test_triangles_peak_at_one_and_sum_to_one_between_centers():
+    filterbank = pst.mel_filterbank(8000, 2048, 20, 100.0, 3000.0)
+    dense = filterbank.dense()
+    assert dense.max() <= 1.0
+    bins = np.arange(dense.shape[1]) * 8000 / 2048
+    inside = (bins >= filterbank.centers[0]) & (bins <= filterbank.centers[-1])
+    assert np.allclose(dense[:, inside].sum(axis=0), 1.0)
+
+
+def test_batch_mel_spectrogram_in_db():
+    clips = np.random.randn(3, 8000)
+    mel, _, _ = pst.compute_mel_spectrogram(clips, rate=8000, n_mels=32, as_db=True)
+    single, _, _ = pst.compute_mel_spectrogram(clips[1], rate=8000, n_mels=32, as_db=True)
+    assert mel.shape[:2] == (3, 32)
+    assert np.allclose(mel[1], single)
+
+
+def test_log_scale_requires_positive_fmin():
+    with pytest.raises(ValueError):
+        pst.mel_filterbank(16000, 1024, 32, 0.0, None, "log")
+    with pytest.warns(RuntimeWarning):
+        pst.mel_filterbank(44100, 256, 64, 0.0, None, "mel")
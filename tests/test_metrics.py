@@ -0,0 +1,71 @@
+import os
+import tempfile
+from unittest import mock
+
+import numpy as np
+import soundfile as sf
+
+import pyspectools2
+from pyspectools2 import metrics
+
+
+def _write_clips(directory, count=2):
+    for i in range(count):
+        sf.write(os.path.join(directory, f"clip_{i}.wav"),
+                 np.random.uniform(-0.5, 0.5, 4000), 8000)
+
+
+def test_no_sinks_uses_shared_noop_span():
+    assert not metrics.enabled()
+    assert metrics.timed("stft") is metrics.timed("decode")
+
+
+def test_collector_receives_load_and_stft_spans():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _write_clips(temp_dir, 1)
+        path = os.path.join(temp_dir, "clip_0.wav")
+
+        with pyspectools2.MetricsCollector() as collector:
+            data, sr = pyspectools2.load_wav(path)
+            pyspectools2.compute_spectrogram(data, rate=sr)
+        pyspectools2.load_wav(path)
+
+        assert collector.spans["decode"].count == 1
+        assert collector.spans["stft"].count == 1
+        assert collector.counters["bytes_read"] == os.path.getsize(path)
+        assert not metrics.enabled()
+
+
+def test_batch_reports_stages_and_file_counts():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _write_clips(temp_dir)
+        with mock.patch("pyspectools2.spectrogram.get_default_directory",
+                        return_value=os.path.join(temp_dir, "out")):
+            with pyspectools2.MetricsCollector() as collector:
+                pyspectools2.batch_process_wavs(temp_dir, fast=True)
+
+    assert collector.counters["files_processed"] == 2
+    for stage in ("decode", "stft", "render", "encode", "write"):
+        assert collector.spans[stage].count == 2
+
+
+def test_batch_pool_replays_worker_events():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _write_clips(temp_dir, 3)
+        with mock.patch("pyspectools2.spectrogram.get_default_directory",
+                        return_value=os.path.join(temp_dir, "out")):
+            with pyspectools2.MetricsCollector() as collector:
+                pyspectools2.batch_process_wavs(temp_dir, workers=2, fast=True)
+
+    assert collector.counters["files_processed"] == 3
+    assert collector.spans["stft"].count == 3
+
+
+def test_failing_sink_warns_without_breaking_the_call():
+    class Broken(pyspectools2.MetricsSink):
+        def span(self, name, seconds, tags):
+            raise RuntimeError("down")
+
+    with Broken(), mock.patch("warnings.warn") as warn:
+        pyspectools2.compute_spectrogram(np.zeros(1024))
+    warn.assert_called()
@@ -0,0 +1,160 @@
+import threading
+import types
+import numpy as np
+import pytest
+import pyspectools2 as pst
+
+
+class FakeInputStream:
+    """Stand-in for sounddevice.InputStream that is fed blocks by the test."""
+
+    def __init__(self, samplerate, channels, blocksize, dtype, callback):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.callback = callback
+        self.started = False
+        self.closed = False
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.started = False
+
+    def close(self):
+        self.closed = True
+
+    def feed(self, block, status=None):
+        block = np.asarray(block, dtype=np.float32).reshape(-1, self.channels)
+        self.callback(block, len(block), None, status)
+
+
+def _make_recorder(**kwargs):
+    streams = []
+
+    def factory(**stream_kwargs):
+        streams.append(FakeInputStream(**stream_kwargs))
+        return streams[-1]
+
+    recorder = pst.ContinuousRecorder(stream_factory=factory, **kwargs)
+    recorder.start()
+    return recorder, streams[0]
+
+
+def test_chunks_are_gapless_and_overlapping():
+    recorder, stream = _make_recorder(rate=100, buffer_seconds=10)
+    signal = np.arange(1000, dtype=np.float32)
+    for block in np.split(signal, 20):
+        stream.feed(block)
+
+    first = recorder.read(2.0, overlap=0.5)
+    second = recorder.read(2.0, overlap=0.5)
+
+    assert np.array_equal(first, signal[:200])
+    assert np.array_equal(second, signal[150:350])
+    assert recorder.overruns == 0
+
+
+def test_overrun_drops_block_and_is_reported():
+    recorder, stream = _make_recorder(rate=100, buffer_seconds=1)
+    stream.feed(np.zeros(80))
+    stream.feed(np.ones(50))
+
+    assert recorder.overruns == 1
+    assert recorder.buffer.dropped_frames == 50
+    assert recorder.buffer.available == 80
+
+
+def test_device_overflow_status_counts_as_overrun():
+    recorder, stream = _make_recorder(rate=100)
+    stream.feed(np.zeros(10), status=types.SimpleNamespace(input_overflow=True))
+    assert recorder.overruns == 1
+
+
+def test_read_blocks_until_audio_arrives():
+    recorder, stream = _make_recorder(rate=100)
+    feeder = threading.Timer(0.05, stream.feed, args=(np.ones(100),))
+    feeder.start()
+
+    chunk = recorder.read(1.0, timeout=5)
+    feeder.join()
+
+    assert chunk is not None and len(chunk) == 100
+
+
+def test_read_times_out_and_stop_ends_chunks():
+    recorder, stream = _make_recorder(rate=100)
+    assert recorder.read(1.0, timeout=0.01) is None
+
+    stream.feed(np.ones(250))
+    recorder.stop()
+
+    chunks = list(recorder.chunks(1.0))
+    assert len(chunks) == 2
+    assert stream.closed
+
+
+def test_multichannel_chunks_keep_channel_axis():
+    recorder, stream = _make_recorder(rate=10, channels=2)
+    stream.feed(np.arange(40))
+
+    chunk = recorder.read(1.0)
+
+    assert chunk.shape == (10, 2)
+    assert np.array_equal(chunk[:, 1], np.arange(1, 20, 2))
+
+
+def test_ring_buffer_rejects_invalid_reads():
+    buffer = pst.RingBuffer(10)
+    with pytest.raises(ValueError):
+        buffer.read(20)
+    with pytest.raises(ValueError):
+        buffer.read(5, advance=6)
+
+
+@pytest.mark.parametrize("block", [1, 100, 3000])
+def test_rolling_spectrogram_matches_full_stft(block):
+    signal = np.random.randn(8000).astype(np.float32)
+    expected, _, times = pst.compute_spectrogram(signal, rate=8000)
+    live = pst.RollingSpectrogram(rate=8000, width=20)
+
+    for start in range(0, len(signal), block):
+        live.push(signal[start:start + block])
+
+    assert live.total_columns == expected.shape[1]
+    assert live.power.shape == (129, 20)
+    assert np.allclose(live.power, expected[:, -20:], rtol=1e-4)
+    assert np.allclose(live.times, times[-20:])
+
+
+def test_rolling_spectrogram_only_adds_new_columns():
+    live = pst.RollingSpectrogram(rate=8000, nfft=256, hop=128, width=10)
+
+    assert live.push(np.zeros(200)) == 0
+    assert live.push(np.zeros(56)) == 1
+    assert live.push(np.zeros(128)) == 1
+    assert live.filled == 2
+
+
+def test_rolling_spectrogram_follows_recorder():
+    recorder, stream = _make_recorder(rate=8000)
+    live = pst.RollingSpectrogram(rate=8000, width=50)
+    stream.feed(np.random.randn(1024))
+    recorder.stop()
+
+    produced = list(live.follow(recorder, hops_per_update=2))
+
+    assert sum(produced) == live.total_columns == 7
+
+
+def test_rolling_spectrogram_plot_ignores_silent_columns():
+    pytest.importorskip("matplotlib")
+    live = pst.RollingSpectrogram(rate=8000, width=40)
+    live.push(np.zeros(2048))
+    live.push(np.random.default_rng(0).standard_normal(2048))
+
+    _, ax = live.plot()
+    vmin, vmax = ax.images[0].get_clim()
+    audible = live.power[live.power > 0]
+    assert np.isclose(vmin, 10 * np.log10(audible.min()))
+    assert np.isclose(vmax, 10 * np.log10(audible.max()))
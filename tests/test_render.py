@@ -0,0 +1,86 @@
+import os
+import struct
+import tempfile
+import zlib
+import numpy as np
+import pytest
+import pyspectools2 as pst
+from pyspectools2.render import colormap_lut, spectrogram_to_indices, write_png
+
+
+def _read_png_chunks(path):
+    with open(path, "rb") as f:
+        assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+        chunks = {}
+        while True:
+            length, tag = struct.unpack(">I4s", f.read(8))
+            chunks[tag] = f.read(length)
+            f.read(4)
+            if tag == b"IEND":
+                return chunks
+
+
+def test_spectrogram_to_rgb_puts_low_frequencies_at_bottom():
+    power = np.ones((4, 3))
+    power[0] = 1e3
+
+    rgb = pst.spectrogram_to_rgb(power)
+
+    assert rgb.shape == (4, 3, 3)
+    assert rgb.dtype == np.uint8
+    lut = colormap_lut("viridis")
+    assert np.array_equal(rgb[-1, 0], lut[255])
+    assert np.array_equal(rgb[0, 0], lut[0])
+
+
+def test_spectrogram_to_indices_ignores_digital_silence():
+    rate = 8000
+    noise = np.random.default_rng(0).standard_normal(rate)
+    power, _, _ = pst.compute_spectrogram(np.concatenate([noise, np.zeros(rate // 2)]),
+                                          rate=rate)
+
+    indices = spectrogram_to_indices(power)[::-1]
+    audible = indices[power > 0]
+    assert audible.min() == 0 and audible.max() == 255
+    assert len(np.unique(audible)) > 100
+    assert np.all(indices[power == 0] == 0)
+
+
+def test_render_spectrogram_image_writes_palette_png():
+    power, _, _ = pst.compute_spectrogram(np.random.randn(4096), rate=8000)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "fast.png")
+        out = pst.render_spectrogram_image(power, path)
+        chunks = _read_png_chunks(path)
+
+    assert out == path
+    width, height, depth, color_type = struct.unpack(
+        ">IIBB", chunks[b"IHDR"][:10])
+    assert (height, width) == power.shape
+    assert (depth, color_type) == (8, 3)
+    assert chunks[b"PLTE"] == colormap_lut("viridis").tobytes()
+
+    raw = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8)
+    rows = raw.reshape(height, width + 1)
+    palette = colormap_lut("viridis")
+    assert np.array_equal(palette[rows[:, 1:]], pst.spectrogram_to_rgb(power))
+
+
+def test_write_png_round_trips_rgb_with_pillow():
+    image_module = pytest.importorskip("PIL.Image")
+    rgb = np.random.randint(0, 256, (5, 7, 3), dtype=np.uint8)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "rgb.png")
+        write_png(path, rgb)
+        with image_module.open(path) as image:
+            decoded = np.asarray(image)
+
+    assert np.array_equal(decoded, rgb)
+
+
+def test_write_png_rejects_bad_shapes():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(ValueError):
+            write_png(os.path.join(temp_dir, "bad.png"), np.zeros((4, 4)))
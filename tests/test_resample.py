@@ -0,0 +1,66 @@
+import os
+import tempfile
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+import pyspectools2 as pst
+from pyspectools2.resample import _polyphase_filter
+
+
+def _reference(x, up, down):
+    """Zero-stuff, filter with the full prototype and decimate."""
+    max_rate = max(up, down)
+    half = 10 * max_rate
+    taps = np.arange(2 * half + 1) - half
+    h = np.sinc(taps / max_rate) * np.kaiser(2 * half + 1, 5.0)
+    h *= up / h.sum()
+    stuffed = np.zeros(len(x) * up)
+    stuffed[::up] = x
+    return np.convolve(stuffed, h)[half::down][:-(-len(x) * up // down)]
+
+
+@pytest.mark.parametrize("orig_sr, target_sr, up, down",
+                         [(44100, 16000, 160, 441), (8000, 16000, 2, 1), (48000, 44100, 147, 160)])
+def test_resample_matches_direct_filtering(orig_sr, target_sr, up, down):
+    x = np.random.randn(1500)
+    y = pst.resample(x, orig_sr, target_sr)
+    assert len(y) == -(-len(x) * target_sr // orig_sr)
+    assert np.allclose(y, _reference(x, up, down))
+
+
+def test_streaming_resampler_matches_one_shot():
+    x = np.random.randn(4000, 2).astype(np.float32)
+    resampler = pst.Resampler(44100, 16000)
+    blocks = [resampler.process(x[i:i + 333]) for i in range(0, len(x), 333)]
+    blocks.append(resampler.flush())
+    streamed = np.concatenate(blocks)
+
+    expected = pst.resample(x, 44100, 16000)
+    assert streamed.dtype == np.float32
+    assert np.allclose(streamed, expected, atol=1e-6)
+
+
+def test_filter_design_is_cached():
+    assert _polyphase_filter(160, 441) is _polyphase_filter(160, 441)
+
+
+def test_load_wav_target_sr_and_resample_wav():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "tone.wav")
+        t = np.arange(8000) / 8000
+        sf.write(path, 0.5 * np.sin(2 * np.pi * 440 * t), 8000, subtype="FLOAT")
+
+        data, sr = pst.load_wav(path, target_sr=16000)
+        assert sr == 16000 and len(data) == 16000
+        assert np.allclose(data, pst.resample(pst.load_wav(path)[0], 8000, 16000))
+
+        out = os.path.join(temp_dir, "tone_16k.wav")
+        pst.resample_wav(path, out, 16000, blocksize=1000)
+        streamed, out_sr = sf.read(out, dtype="float32")
+        assert out_sr == 16000
+        assert np.allclose(streamed, data, atol=1e-6)
+
+        with pytest.raises(ValueError):
+            pst.load_wav(path, mmap=True, target_sr=16000)
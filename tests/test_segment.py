@@ -0,0 +1,97 @@
+import os
+import tempfile
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+import pyspectools2 as pst
+
+RATE = 8000
+
+
+def _recording():
+    rng = np.random.default_rng(0)
+    audio = np.zeros(RATE * 10, dtype=np.float32)
+    audio[8000:16000] = rng.uniform(-0.5, 0.5, 8000)
+    audio[16500:20000] = rng.uniform(-0.5, 0.5, 3500)
+    audio[60000:70000] = rng.uniform(-0.5, 0.5, 10000)
+    audio[79950:] = 0.5
+    return audio
+
+
+def test_frame_rms_matches_framed_reference():
+    audio = np.random.default_rng(1).standard_normal((5000, 2))
+    rms = pst.frame_rms(audio, frame_length=256, hop=100)
+
+    starts = range(0, len(audio) - 255, 100)
+    expected = [np.sqrt(np.mean(audio[s:s + 256] ** 2)) for s in starts]
+    assert np.allclose(rms, expected)
+    assert len(pst.frame_rms(audio[:100], frame_length=256)) == 0
+
+
+def test_segment_audio_bridges_gaps_and_drops_short_bursts():
+    intervals = pst.segment_audio(_recording(), RATE)
+
+    # The 500-sample gap is bridged and the 50-sample tail is too short.
+    assert len(intervals) == 2
+    (first_start, first_stop), (second_start, second_stop) = intervals
+    assert first_start <= 8000 < 20000 <= first_stop < 20000 + 1024
+    assert second_start <= 60000 < 70000 <= second_stop
+
+    split = pst.segment_audio(_recording(), RATE, frame_length=256, hop=128,
+                              min_silence=0.01)
+    assert len(split) == 3
+
+
+def test_segment_audio_drops_short_click():
+    audio = np.zeros(RATE * 2, dtype=np.float32)
+    audio[RATE:RATE + 20] = 0.9
+
+    assert len(pst.segment_audio(audio, RATE)) == 0
+    assert len(pst.segment_audio(audio, RATE, frame_length=256, hop=64)) == 0
+    assert len(pst.segment_audio(audio, RATE, min_active=0)) == 1
+
+
+def test_segment_audio_hysteresis_holds_between_thresholds():
+    audio = np.concatenate([np.full(4096, 0.5), np.full(8192, 0.02), np.zeros(8192)])
+
+    held = pst.segment_audio(audio, RATE, threshold=0.1, release=0.01, min_silence=0)
+    dropped = pst.segment_audio(audio, RATE, threshold=0.1, release=0.05, min_silence=0)
+    assert held[0][1] > 4096 + 8192
+    assert dropped[0][1] < 4096 + 1024
+    with pytest.raises(ValueError):
+        pst.Segmenter(RATE, threshold=0.1, release=0.2)
+
+
+def test_segmenter_streaming_matches_one_shot():
+    audio = _recording()
+    expected = pst.segment_audio(audio, RATE).tolist()
+
+    for blocksize in (7, 500, 4096):
+        segmenter = pst.Segmenter(RATE)
+        intervals = []
+        for start in range(0, len(audio), blocksize):
+            intervals += segmenter.process(audio[start:start + blocksize])
+        intervals += segmenter.flush()
+        assert [list(interval) for interval in intervals] == expected
+
+
+def test_segment_wav_and_iter_active_segments():
+    audio = _recording()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "long.wav")
+        sf.write(path, np.stack([audio, audio], axis=1), RATE, subtype="FLOAT")
+
+        intervals, sr = pst.segment_wav(path, blocksize=3000)
+        assert sr == RATE
+        assert intervals.tolist() == pst.segment_audio(audio, RATE).tolist()
+
+        segments = list(pst.iter_active_segments(path, blocksize=3000))
+        assert len(segments) == len(intervals)
+        for segment, (start, stop) in zip(segments, intervals):
+            assert segment.start == start / RATE
+            assert np.allclose(segment.audio, audio[start:stop])
+
+    kept = pst.remove_silence(audio, RATE)
+    assert len(kept) == sum(stop - start for start, stop in intervals)
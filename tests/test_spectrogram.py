@@ -1,4 +1,5 @@
 from pyspectools2 import spectrogram
+import os
 import sys
 import tempfile
 import types
@@ -162,3 +163,69 @@ def test_print_folder_size_when_no_session(capsys):
         captured = capsys.readouterr()
 
     assert "No session folder found." in captured.out
+
+
+def test_get_folder_size_in_parallel_matches_serial():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for i in range(4):
+            nested = Path(temp_dir, f"d{i}", "inner")
+            nested.mkdir(parents=True)
+            Path(temp_dir, f"d{i}", "a.bin").write_bytes(b"x" * (i + 1))
+            Path(nested, "b.bin").write_bytes(b"y" * 10)
+        Path(temp_dir, "top.bin").write_bytes(b"z" * 3)
+
+        serial = spectrogram.get_folder_size(temp_dir)
+        parallel = spectrogram.get_folder_size(temp_dir, workers=4)
+
+    assert serial == parallel == 3 + (1 + 2 + 3 + 4) + 40
+
+
+def test_cached_folder_size_tracks_library_writes_without_rescanning():
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Path(temp_dir, "a.bin").write_bytes(b"12345")
+        assert spectrogram.get_folder_size(temp_dir, cached=True) == 5
+
+        wav_path = os.path.join(temp_dir, "clip.wav")
+        spectrogram.save_wav(wav_path, np.zeros(100, dtype=np.float32), 8000)
+        expected = 5 + os.path.getsize(wav_path)
+
+        with mock.patch("pyspectools2.spectrogram.os.scandir",
+                        side_effect=AssertionError("rescanned")):
+            assert spectrogram.get_folder_size(temp_dir, cached=True) == expected
+
+
+def test_cached_folder_size_rescans_after_external_change():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Path(temp_dir, "a.bin").write_bytes(b"12345")
+        assert spectrogram.get_folder_size(temp_dir, cached=True) == 5
+
+        Path(temp_dir, "b.bin").write_bytes(b"123")
+        os.utime(temp_dir, ns=(0, 0))
+
+        assert spectrogram.get_folder_size(temp_dir, cached=True) == 8
+
+
+def test_invalidate_folder_size_after_in_place_change():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir, "a.bin")
+        path.write_bytes(b"x" * 6000)
+        assert spectrogram.get_folder_size(temp_dir, cached=True) == 6000
+
+        with open(path, "ab") as f:
+            f.write(b"y" * 100000)
+        spectrogram.invalidate_folder_size(temp_dir)
+
+        assert spectrogram.get_folder_size(temp_dir, cached=True) == 106000
+
+
+def test_folder_size_with_subdirectories_is_not_cached():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Path(temp_dir, "a.bin").write_bytes(b"x" * 10)
+        os.makedirs(os.path.join(temp_dir, "sub"))
+        assert spectrogram.get_folder_size(temp_dir, cached=True) == 10
+
+        Path(temp_dir, "sub", "b.bin").write_bytes(b"y" * 1000)
+
+        assert spectrogram.get_folder_size(temp_dir, cached=True) == 1010
@@ -0,0 +1,213 @@
+import os
+import tempfile
+import numpy as np
+import pytest
+import soundfile as sf
+import pyspectools2 as pst
+
+
+def test_compute_spectrogram_shapes_and_axes():
+    rate = 16000
+    data = np.random.randn(4096)
+
+    power, freqs, times = pst.compute_spectrogram(
+        data, rate=rate, nfft=256, hop=128)
+
+    assert power.shape == (129, 31)
+    assert freqs[0] == 0.0
+    assert freqs[-1] == pytest.approx(rate / 2)
+    assert times[0] == pytest.approx(128 / rate)
+    assert np.all(np.diff(times) == pytest.approx(128 / rate))
+
+
+def test_compute_spectrogram_peak_at_tone_frequency():
+    rate = 8000
+    t = np.arange(rate) / rate
+    tone = np.sin(2 * np.pi * 1000 * t)
+
+    power, freqs, _ = pst.compute_spectrogram(tone, rate=rate, nfft=512)
+
+    peak = freqs[np.argmax(power.mean(axis=1))]
+    assert peak == pytest.approx(1000, abs=rate / 512)
+
+
+def test_compute_spectrogram_matches_matplotlib_specgram():
+    mlab = pytest.importorskip("matplotlib.mlab")
+    data = np.random.randn(5000)
+
+    power, freqs, times = pst.compute_spectrogram(data, rate=22050)
+    expected, exp_freqs, exp_times = mlab.specgram(
+        data, NFFT=256, Fs=22050, noverlap=128)
+
+    assert np.allclose(power, expected)
+    assert np.allclose(freqs, exp_freqs)
+    assert np.allclose(times, exp_times)
+
+
+def test_plot_spectrogram_color_limits_ignore_digital_silence():
+    pytest.importorskip("matplotlib")
+    rate = 8000
+    noise = np.random.default_rng(0).standard_normal(rate)
+    data = np.concatenate([noise, np.zeros(rate // 2)])
+
+    fig, ax = pst.plot_spectrogram(data, rate=rate)
+    vmin, vmax = ax.images[0].get_clim()
+
+    power, _, _ = pst.compute_spectrogram(data, rate=rate)
+    nonzero = 10 * np.log10(power[power > 0])
+    assert np.isclose(vmin, nonzero.min())
+    assert np.isclose(vmax, nonzero.max())
+    assert vmin > -400
+
+
+def test_compute_spectrogram_pads_short_signal():
+    power, _, times = pst.compute_spectrogram(np.ones(100), nfft=256)
+    assert power.shape == (129, 1)
+    assert len(times) == 1
+
+
+def test_compute_spectrogram_rejects_bad_window():
+    with pytest.raises(ValueError):
+        pst.compute_spectrogram(np.zeros(512), window="nope")
+    with pytest.raises(ValueError):
+        pst.compute_spectrogram(np.zeros(512), nfft=256, window=np.ones(10))
+
+
+def test_spectrogram_cache_counts_hits_and_misses():
+    pst.clear_spectrogram_cache()
+    data = np.random.randn(2048)
+
+    pst.compute_spectrogram(data, rate=16000)
+    pst.compute_spectrogram(data, rate=16000)
+    pst.compute_spectrogram(data[:1024], rate=16000)
+
+    info = pst.spectrogram_cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.currsize == 2
+
+
+def test_spectrogram_cache_evicts_least_recently_used():
+    pst.clear_spectrogram_cache()
+    pst.set_spectrogram_cache_size(2)
+    try:
+        for length in (512, 1024, 2048):
+            pst.compute_spectrogram(np.zeros(length))
+        assert pst.spectrogram_cache_info().currsize == 2
+
+        # 512 was evicted, so this is another miss.
+        pst.compute_spectrogram(np.zeros(512))
+        assert pst.spectrogram_cache_info().misses == 4
+    finally:
+        pst.set_spectrogram_cache_size(128)
+        pst.clear_spectrogram_cache()
+
+
+def test_spectrogram_cache_keys_array_windows_by_value():
+    pst.clear_spectrogram_cache()
+    data = np.random.randn(1024)
+
+    pst.compute_spectrogram(data, window=np.hamming(256))
+    pst.compute_spectrogram(data, window=np.hamming(256))
+
+    assert pst.spectrogram_cache_info().hits == 1
+
+
+def test_compute_spectrogram_leaves_window_array_writable():
+    window = np.hamming(256)
+
+    pst.compute_spectrogram(np.random.randn(1024), window=window)
+
+    assert window.flags.writeable
+    window[0] = 1.0
+
+
+def _write_noise(path, frames, channels=1, rate=8000):
+    data = (np.random.randn(frames, channels) * 0.2).astype(np.float32)
+    sf.write(path, data, rate, subtype="FLOAT")
+    return rate
+
+
+@pytest.mark.parametrize("frames", [0, 100, 5000, 12345])
+def test_iter_wav_spectrogram_matches_in_memory(frames):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "long.wav")
+        rate = _write_noise(path, frames, channels=2)
+        data, _ = pst.load_wav(path)
+        expected, _, exp_times = pst.compute_spectrogram(data, rate=rate)
+
+        chunks = list(pst.iter_wav_spectrogram(path, columns_per_block=7))
+
+    power = np.concatenate([chunk[0] for chunk in chunks], axis=1)
+    times = np.concatenate([chunk[2] for chunk in chunks])
+    assert power.shape == expected.shape
+    assert np.allclose(power, expected, rtol=1e-4, atol=1e-9)
+    assert np.allclose(times, exp_times)
+
+
+def test_compute_wav_spectrogram_fills_empty_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "empty.wav")
+        rate = _write_noise(path, 0)
+        out = np.full((129, 1), np.nan, dtype=np.float32)
+
+        power, _, times = pst.compute_wav_spectrogram(path, out=out)
+
+    expected, _, exp_times = pst.compute_spectrogram(np.zeros(0), rate=rate)
+    assert np.array_equal(power, expected)
+    assert np.allclose(times, exp_times)
+
+
+def test_compute_wav_spectrogram_writes_memmap():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "long.wav")
+        rate = _write_noise(path, 9000)
+        data, _ = pst.load_wav(path)
+        expected, _, _ = pst.compute_spectrogram(data, rate=rate)
+
+        out_path = os.path.join(temp_dir, "power.npy")
+        power, freqs, times = pst.compute_wav_spectrogram(
+            path, out=out_path, columns_per_block=16)
+
+        assert isinstance(power, np.memmap)
+        assert len(freqs) == power.shape[0]
+        assert len(times) == power.shape[1]
+        assert np.allclose(np.load(out_path), expected, rtol=1e-4, atol=1e-9)
+        del power
+
+
+def test_compute_wav_spectrogram_rejects_wrong_output_shape():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "short.wav")
+        _write_noise(path, 1000)
+        with pytest.raises(ValueError):
+            pst.compute_wav_spectrogram(path, out=np.empty((10, 10)))
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 3])
+def test_compute_spectrogram_batch_matches_per_clip(batch_size):
+    clips = np.random.randn(5, 2048)
+    power, freqs, times = pst.compute_spectrogram_batch(
+        clips, rate=8000, nfft=256, hop=64, batch_size=batch_size)
+
+    expected, exp_freqs, exp_times = pst.compute_spectrogram(
+        clips[2], rate=8000, nfft=256, hop=64)
+    assert power.shape == (5,) + expected.shape
+    assert np.allclose(power[2], expected)
+    assert np.array_equal(freqs, exp_freqs)
+    assert np.array_equal(times, exp_times)
+
+
+def test_compute_spectrogram_batch_pads_ragged_clips():
+    clips = [np.random.randn(n) for n in (100, 1024, 600)]
+    power, _, times = pst.compute_spectrogram_batch(clips, nfft=256, hop=128)
+
+    assert power.shape[0] == 3
+    short, _, short_times = pst.compute_spectrogram(clips[2], nfft=256, hop=128)
+    assert np.allclose(power[2][:, :len(short_times)], short)
+    assert len(times) == pst.compute_spectrogram(clips[1], nfft=256, hop=128)[0].shape[1]
+
+
+def test_compute_spectrogram_batch_rejects_1d_input():
+    with pytest.raises(ValueError):
+        pst.compute_spectrogram_batch(np.zeros(1024))
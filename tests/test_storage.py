@@ -0,0 +1,72 @@
+import os
+import tempfile
+import numpy as np
+import pytest
+import pyspectools2 as pst
+
+
+def _spectrogram(seconds=4, rate=8000, silence=0):
+    data = np.concatenate([np.random.randn(seconds * rate), np.zeros(silence * rate)])
+    return pst.compute_spectrogram(data, rate=rate)
+
+
+@pytest.mark.parametrize("encoding, tolerance_db", [
+    ("float32", 1e-3), ("float16", 0.05), ("uint8", 0.5)])
+@pytest.mark.parametrize("silence", [0, 1])
+def test_spectrogram_data_round_trip(encoding, tolerance_db, silence):
+    power, freqs, times = _spectrogram(silence=silence)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "clip.spec")
+        pst.save_spectrogram_data(path, power, freqs, times, encoding=encoding)
+        loaded, loaded_freqs, loaded_times = pst.load_spectrogram_data(path)
+
+    assert loaded.shape == power.shape
+    assert np.array_equal(loaded_freqs, freqs)
+    assert np.array_equal(loaded_times, times)
+    # Digitally silent bins decode to the quantization floor; compare the rest.
+    audible = power > 0
+    assert audible.any()
+    error = np.abs(10 * np.log10(loaded[audible]) - 10 * np.log10(power[audible]))
+    assert error.max() < tolerance_db
+
+
+def test_spectrogram_data_is_compact():
+    power, freqs, times = _spectrogram()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "clip.spec")
+        pst.save_spectrogram_data(path, power, freqs, times, encoding="uint8")
+        size = os.path.getsize(path)
+
+    assert size < power.nbytes / 4
+
+
+def test_load_spectrogram_data_slices_time_range():
+    power, freqs, times = _spectrogram()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "clip.spec")
+        pst.save_spectrogram_data(path, power, freqs, times, encoding="float32")
+        part, _, part_times = pst.load_spectrogram_data(
+            path, start=1.0, stop=2.0, as_db=True)
+
+    mask = (times >= 1.0) & (times < 2.0)
+    assert np.array_equal(part_times, times[mask])
+    assert np.allclose(part, 10 * np.log10(power[:, mask]), atol=1e-3)
+
+
+def test_spectrogram_data_rejects_bad_input():
+    power, freqs, times = _spectrogram(seconds=1)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "clip.spec")
+        with pytest.raises(ValueError):
+            pst.save_spectrogram_data(path, power, freqs, times, encoding="int4")
+        with pytest.raises(ValueError):
+            pst.save_spectrogram_data(path, power, freqs[:-1], times)
+
+        with open(path, "wb") as f:
+            f.write(b"not a spectrogram")
+        with pytest.raises(ValueError):
+            pst.load_spectrogram_data(path)
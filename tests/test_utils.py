@@ -113,7 +113,8 @@ def test_load_and_plot_wav_wrapper():
 
                 pst.load_and_plot_wav("dummy.wav")
 
-                mock_load.assert_called_with("dummy.wav")
+                mock_load.assert_called_with(
+                    "dummy.wav", start=None, stop=None, unit="seconds")
 
                 # Verify that a plot was actually saved somewhere in the tmp_dir tree
                 png_found = False
@@ -62,9 +62,10 @@ def test_load_wavs_from_directory():
         assert len(wavs) == 1
 
 
+@mock.patch("pyspectools2.spectrogram.plt.close")
 @mock.patch("pyspectools2.spectrogram.create_session_folder")
 @mock.patch("pyspectools2.spectrogram.plot_spectrogram")
-def test_batch_process_wavs(mock_plot, mock_create):
+def test_batch_process_wavs(mock_plot, mock_create, mock_close):
     """
     Test the batch processing loop.
     Note: save_spectrogram is not mocked here because batch_process_wavs
@@ -85,10 +86,120 @@ def test_batch_process_wavs(mock_plot, mock_create):
         mock_plot.return_value = (mock_fig, mock_ax)
 
         # Execute
-        pyspectools2.batch_process_wavs(temp_dir)
+        results = pyspectools2.batch_process_wavs(temp_dir)
 
         # Assertions
         mock_create.assert_called_once()
         mock_plot.assert_called_once()
         mock_fig.savefig.assert_called_once()
-        mock_fig.clear.assert_called_once()
+        mock_close.assert_called_once_with(mock_fig)
+        assert results == [pyspectools2.BatchResult(
+            "test.wav", os.path.join(temp_dir, "test.png"), None)]
+
+
+@mock.patch("pyspectools2.spectrogram.create_session_folder")
+def test_batch_process_wavs_reports_errors_per_file(mock_create):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_dir = os.path.join(temp_dir, "out")
+        os.mkdir(out_dir)
+        mock_create.return_value = out_dir
+        sf.write(os.path.join(temp_dir, "good.wav"),
+                 np.random.uniform(-0.5, 0.5, 1024).astype(np.float32), 8000)
+        with open(os.path.join(temp_dir, "broken.wav"), "wb") as f:
+            f.write(b"not a wav file")
+
+        results = pyspectools2.batch_process_wavs(temp_dir)
+
+        assert [r.file for r in results] == ["broken.wav", "good.wav"]
+        assert results[0].output_path is None
+        assert results[0].error
+        assert results[1].error is None
+        assert os.path.exists(os.path.join(out_dir, "good.png"))
+
+
+@mock.patch("pyspectools2.spectrogram.create_session_folder")
+def test_batch_process_wavs_with_process_pool(mock_create):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_dir = os.path.join(temp_dir, "out")
+        os.mkdir(out_dir)
+        mock_create.return_value = out_dir
+        for i in range(4):
+            sf.write(os.path.join(temp_dir, f"clip_{i}.wav"),
+                     np.random.uniform(-0.5, 0.5, 1024).astype(np.float32), 8000)
+
+        results = pyspectools2.batch_process_wavs(temp_dir, workers=2)
+
+        assert [r.file for r in results] == [f"clip_{i}.wav" for i in range(4)]
+        assert all(r.error is None for r in results)
+        assert sorted(os.listdir(out_dir)) == [
+            f"clip_{i}.png" for i in range(4)]
+
+
+def test_iter_wavs_from_directory_yields_in_sorted_order():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sr = 8000
+        for i in (3, 1, 2):
+            sf.write(os.path.join(temp_dir, f"clip_{i}.wav"),
+                     np.full(100, i / 10, dtype=np.float32), sr)
+        open(os.path.join(temp_dir, "notes.txt"), "w").close()
+
+        results = list(pyspectools2.iter_wavs_from_directory(
+            temp_dir, workers=2, prefetch=2))
+
+    assert [name for name, _ in results] == [
+        "clip_1.wav", "clip_2.wav", "clip_3.wav"]
+    data, rate = results[1][1]
+    assert rate == sr
+    assert np.allclose(data, 0.2, atol=1e-4)
+
+
+def test_iter_wavs_from_directory_bounds_prefetch():
+    started = []
+
+    def fake_load(path, **kwargs):
+        started.append(os.path.basename(path))
+        return np.zeros(1), 8000
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for i in range(10):
+            open(os.path.join(temp_dir, f"clip_{i}.wav"), "w").close()
+
+        with mock.patch("pyspectools2.spectrogram.load_wav", side_effect=fake_load):
+            iterator = pyspectools2.iter_wavs_from_directory(
+                temp_dir, workers=2, prefetch=3)
+            next(iterator)
+            # One consumed plus three decoded ahead.
+            assert len(started) <= 4
+            iterator.close()
+
+    assert len(started) <= 4
+
+
+@mock.patch("pyspectools2.spectrogram.create_session_folder")
+def test_batch_process_wavs_fast_renderer(mock_create):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_dir = os.path.join(temp_dir, "out")
+        os.mkdir(out_dir)
+        mock_create.return_value = out_dir
+        sf.write(os.path.join(temp_dir, "clip.wav"),
+                 np.random.uniform(-0.5, 0.5, 2048).astype(np.float32), 8000)
+
+        results = pyspectools2.batch_process_wavs(temp_dir, fast=True)
+
+        assert results[0].error is None
+        with open(os.path.join(out_dir, "clip.png"), "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+
+
+def test_batch_process_wavs_output_directory():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_dir = os.path.join(temp_dir, "sessions")
+        sf.write(os.path.join(temp_dir, "clip.wav"),
+                 np.random.uniform(-0.5, 0.5, 2048).astype(np.float32), 8000)
+
+        results = pyspectools2.batch_process_wavs(temp_dir, fast=True,
+                                                  output_directory=out_dir)
+
+        assert results[0].error is None
+        assert results[0].output_path == os.path.join(out_dir, "session_1", "clip.png")
+        assert os.path.exists(results[0].output_path)
@@ -2,6 +2,7 @@ import os
 import tempfile
 import numpy as np
 import pytest
+import soundfile as sf
 import pyspectools2 as pst
 
 
@@ -97,3 +98,154 @@ def test_get_wav_info_integrity():
         assert info["duration_sec"] == 1.0
         assert info["frames"] == 16000
         assert info["channels"] == 1
+
+
+@pytest.mark.parametrize("subtype", ["PCM_16", "PCM_32", "PCM_U8", "FLOAT"])
+def test_load_wav_mmap_keeps_native_layout(subtype):
+    """
+    Verify mmap=True returns a memmap that pcm_to_float decodes like load_wav.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "mapped.wav")
+        data = np.random.uniform(-0.8, 0.8, (2000, 2))
+        sf.write(file_path, data, 16000, subtype=subtype)
+
+        decoded, _ = pst.load_wav(file_path)
+        mapped, sr = pst.load_wav(file_path, mmap=True)
+
+        assert isinstance(mapped, np.memmap)
+        assert mapped.shape == (2000, 2)
+        assert sr == 16000
+        assert np.allclose(pst.pcm_to_float(mapped[100:300]), decoded[100:300])
+        del mapped
+
+
+def test_load_wav_mmap_rejects_24_bit():
+    """
+    24-bit samples have no native numpy dtype and cannot be memory-mapped.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "pcm24.wav")
+        sf.write(file_path, np.zeros(100), 16000, subtype="PCM_24")
+
+        with pytest.raises(ValueError):
+            pst.load_wav(file_path, mmap=True)
+
+
+def test_pcm_to_float_keeps_channels_when_requested():
+    """
+    Verify pcm_to_float scales int16 and can keep the channel axis.
+    """
+    pcm = np.array([[16384, -32768], [0, 8192]], dtype=np.int16)
+
+    out = pst.pcm_to_float(pcm, mono=False)
+
+    assert out.dtype == np.float32
+    assert np.allclose(out, [[0.5, -1.0], [0.0, 0.25]])
+
+
+def test_load_wav_reads_only_requested_range():
+    """
+    Verify start/stop select the same samples in seconds and in frames.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "ramp.wav")
+        sr = 1000
+        data = np.linspace(-1, 1, 5 * sr, dtype=np.float32)
+        sf.write(file_path, data, sr, subtype="FLOAT")
+
+        by_seconds, _ = pst.load_wav(file_path, start=1.5, stop=2.0)
+        by_frames, _ = pst.load_wav(
+            file_path, start=1500, stop=2000, unit="frames")
+        mapped, _ = pst.load_wav(file_path, mmap=True, start=1.5, stop=2.0)
+
+        assert len(by_seconds) == 500
+        assert np.array_equal(by_seconds, data[1500:2000])
+        assert np.array_equal(by_frames, by_seconds)
+        assert np.array_equal(pst.pcm_to_float(mapped), by_seconds)
+        del mapped
+
+
+def test_load_wav_range_is_clamped_and_validated():
+    """
+    Ranges past the end are clamped; inverted ranges are rejected.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "short.wav")
+        sf.write(file_path, np.zeros(1000, dtype=np.float32), 1000)
+
+        tail, _ = pst.load_wav(file_path, start=0.9, stop=10)
+        assert len(tail) == 100
+
+        with pytest.raises(ValueError):
+            pst.load_wav(file_path, start=0.5, stop=0.2)
+        with pytest.raises(ValueError):
+            pst.load_wav(file_path, start=0, unit="minutes")
+
+
+def test_load_wav_keeps_channels_for_multichannel_spectrogram():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "array.wav")
+        data = np.random.uniform(-0.5, 0.5, (4000, 4)).astype(np.float32)
+        sf.write(file_path, data, 8000, subtype="FLOAT")
+
+        loaded, sr = pst.load_wav(file_path, mono=False)
+        assert loaded.shape == (4000, 4)
+        assert np.allclose(loaded, data)
+
+        power, freqs, times = pst.compute_multichannel_spectrogram(loaded, rate=sr)
+        expected, _, _ = pst.compute_spectrogram(loaded[:, 2], rate=sr)
+        assert power.shape == (4,) + expected.shape
+        assert np.allclose(power[2], expected)
+
+
+def test_normalize_audio_out_in_place():
+    audio_data = np.array([0.1, -0.4, 0.2], dtype=np.float32)
+    expected = pst.normalize_audio(audio_data)
+
+    result = pst.normalize_audio(audio_data, out=audio_data)
+    assert result is audio_data
+    assert np.allclose(audio_data, expected)
+
+
+def test_normalize_wav_streams_trimmed_output():
+    """
+    The streaming file version matches the in-memory pipeline, including
+    when the loud region spans several blocks.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, "input.wav")
+        output_path = os.path.join(temp_dir, "output.wav")
+        rng = np.random.default_rng(0)
+        data = np.zeros((5000, 2), dtype=np.float32)
+        data[1234:3901] = rng.uniform(-0.25, 0.25, (2667, 2))
+        data[1234, 1] = 0.2
+        sf.write(input_path, data, 8000, subtype="FLOAT")
+
+        assert pst.normalize_wav(input_path, output_path, trim=True, threshold=0.05,
+                                 blocksize=500) == output_path
+        written, sr = sf.read(output_path, dtype="float32", always_2d=True)
+        expected = pst.trim_silence(pst.normalize_audio(data), threshold=0.05)
+
+        assert sr == 8000
+        assert sf.info(output_path).subtype == "FLOAT"
+        assert written.shape == expected.shape
+        assert np.allclose(written, expected)
+
+
+def test_trim_silence_wav_keeps_level_and_silent_files():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, "input.wav")
+        output_path = os.path.join(temp_dir, "output.wav")
+        data = np.zeros(3000, dtype=np.float32)
+        data[700:2100] = 0.5
+        sf.write(input_path, data, 8000, subtype="PCM_16")
+
+        pst.trim_silence_wav(input_path, output_path, threshold=0.1, blocksize=256)
+        written, _ = sf.read(output_path, dtype="float32")
+        assert np.allclose(written, data[700:2100], atol=1e-4)
+
+        silent_path = os.path.join(temp_dir, "silent.wav")
+        sf.write(silent_path, np.zeros(1000, dtype=np.float32), 8000)
+        pst.normalize_wav(silent_path, output_path, trim=True)
+        assert sf.info(output_path).frames == 1000
@@ -0,0 +1,79 @@
+import os
+import queue
+import tempfile
+import threading
+import warnings
+from unittest import mock
+import numpy as np
+import pytest
+import soundfile as sf
+import pyspectools2 as pst
+
+
+def test_writer_writes_wav_array_and_image():
+    power = np.random.rand(129, 20)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pst.OutputWriter(workers=2) as writer:
+            wav = writer.submit_wav(os.path.join(temp_dir, "a.wav"),
+                                    np.zeros(100, dtype=np.float32), 8000)
+            arr = writer.submit_array(os.path.join(temp_dir, "a.npy"), power)
+            png = writer.submit_image(power, os.path.join(temp_dir, "a.png"))
+
+        assert wav.done() and arr.done() and png.done()
+        assert sf.info(os.path.join(temp_dir, "a.wav")).frames == 100
+        assert np.array_equal(np.load(os.path.join(temp_dir, "a.npy")), power)
+        assert png.result() == os.path.join(temp_dir, "a.png")
+
+
+def test_writer_applies_backpressure():
+    release = threading.Event()
+    writer = pst.OutputWriter(workers=1, max_pending=2, timeout=0.05)
+    try:
+        writer.submit(release.wait)
+        writer.submit(release.wait)
+        assert writer.pending == 2
+        with pytest.raises(queue.Full):
+            writer.submit(release.wait)
+    finally:
+        release.set()
+        writer.shutdown()
+    assert writer.pending == 0
+
+
+def test_writer_surfaces_errors_through_future():
+    with pst.OutputWriter() as writer:
+        future = writer.submit_array("/nonexistent/dir/out.npy", np.zeros(3))
+        writer.flush()
+    assert isinstance(future.exception(), OSError)
+
+
+def test_save_spectrogram_with_writer_returns_immediately():
+    fig = mock.Mock()
+    with tempfile.TemporaryDirectory() as temp_dir, \
+            mock.patch("pyspectools2.spectrogram.plt.close") as close_mock:
+        with pst.OutputWriter() as writer:
+            out = pst.save_spectrogram(fig, temp_dir, writer=writer)
+            writer.flush()
+
+    fig.savefig.assert_called_once_with(out)
+    close_mock.assert_called_once_with(fig)
+
+
+def test_save_spectrogram_reports_failed_background_write():
+    fig = mock.Mock()
+    fig.savefig.side_effect = FileNotFoundError("no such directory")
+
+    with pytest.warns(RuntimeWarning, match="Background write"):
+        with pst.OutputWriter() as writer:
+            pst.save_spectrogram(fig, "/nonexistent/dir", writer=writer)
+            writer.flush()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pst.OutputWriter() as writer:
+            out, future = pst.save_spectrogram(fig, "/nonexistent/dir", writer=writer,
+                                               return_future=True)
+            writer.flush()
+    assert out.startswith("/nonexistent/dir")
+    assert isinstance(future.exception(), FileNotFoundError)